@@ -0,0 +1,182 @@
+"""Asyncio versions of the ``auxly.shell`` functions. Requires Python 3.6+;
+the functions are imported into ``auxly.shell`` when available."""
+
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import asyncio
+import functools
+import os
+import os.path as op
+import signal
+import subprocess
+import tempfile
+
+import top as auxly
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+#: Size in bytes of the blocks read from command output pipes.
+_PIPESIZE = 0x10000
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class AsyncProcess(object):
+    """Same as ``Process`` but for use within an asyncio event loop. Created by
+    ``astart()``."""
+    def __init__(self, cmd, proc, logfile):
+        self._cmd = cmd
+        self._proc = proc
+        self._logfile = logfile
+        #: The process PID.
+        self.pid = proc.pid
+    def __repr__(self):
+        return "AsyncProcess: " + self._cmd
+    def stop(self):
+        """Stops the started process without waiting for it to exit."""
+        self._logfile.close()
+        if self.exitcode() != None:
+            return
+        try:
+            if auxly.iswindows():
+                self._proc.send_signal(signal.CTRL_BREAK_EVENT)
+            self._proc.terminate()
+            self._proc.kill()
+        except:
+            pass
+    def isrunning(self):
+        """Returns true if the process is still running, otherwise false."""
+        return self.exitcode() == None
+    def exitcode(self):
+        """Returns None if the process is still running, otherwise the
+        exit code."""
+        return self._proc.returncode
+    async def wait(self):
+        """Waits for the process to complete then returns the exit code."""
+        code = await self._proc.wait()
+        self._logfile.close()
+        return code
+
+##==============================================================#
+## SECTION: Function Definitions                                #
+##==============================================================#
+
+async def acall(cmd, **kwargs):
+    """Same as ``call()`` but awaitable.
+
+    **Examples**:
+    ::
+        await auxly.shell.acall("ls")
+    """
+    proc = await asyncio.create_subprocess_shell(cmd, **kwargs)
+    return await proc.wait()
+
+async def asilent(cmd, **kwargs):
+    """Same as ``silent()`` but awaitable."""
+    return await acall(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **kwargs)
+
+async def astart(cmd, logpath=None, **kwargs):
+    """Same as ``start()`` but awaitable. Returns an ``AsyncProcess`` object.
+
+    **Examples**:
+    ::
+        p = await auxly.shell.astart("python -m http.server")
+        ...
+        p.stop()
+        await p.wait()
+    """
+    if logpath:
+        logpath = op.abspath(logpath)
+        if not op.isdir(op.dirname(logpath)):
+            os.makedirs(op.dirname(logpath))
+        logfile = open(logpath, "w")
+    else:
+        # NOTE: See the note in ``Process`` on using a temp file.
+        logfile = tempfile.NamedTemporaryFile("w", delete=True)
+    if auxly.iswindows():
+        kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+    proc = await asyncio.create_subprocess_shell(
+            cmd,
+            stdout=logfile,
+            stderr=logfile,
+            stdin=subprocess.PIPE,
+            **kwargs)
+    return AsyncProcess(cmd, proc, logfile)
+
+async def aiterstd(cmd, std="out", **kwargs):
+    """Same as ``iterstd()`` but an async iterator. Only the requested stream
+    is piped; the other is discarded.
+
+    **Examples**:
+    ::
+        async for line in auxly.shell.aiterout("cat myfile.txt"):
+            print(line)
+    """
+    other = "err" if "out" == std else "out"
+    kwargs['std' + std] = subprocess.PIPE
+    kwargs['std' + other] = subprocess.DEVNULL
+    proc = await asyncio.create_subprocess_shell(cmd, **kwargs)
+    pipe = getattr(proc, "std" + std)
+    partial = b""
+    try:
+        # NOTE: Read in blocks rather than lines so that lines longer than the
+        # stream reader limit are not an error.
+        while True:
+            data = await pipe.read(_PIPESIZE)
+            if not data:
+                break
+            lines = (partial + data).split(b"\n")
+            partial = lines.pop()
+            for line in lines:
+                yield line.rstrip().decode("UTF-8", "replace")
+        if partial:
+            yield partial.rstrip().decode("UTF-8", "replace")
+    finally:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+        await proc.wait()
+
+##--------------------------------------------------------------#
+## Stdout related functions.                                    #
+##--------------------------------------------------------------#
+
+#: Async iterator through lines of stdout.
+aiterout = functools.partial(aiterstd, std="out")
+
+async def alistout(cmd, **kwargs):
+    """Same as ``aiterout()`` but returns a list."""
+    return [line async for line in aiterout(cmd, **kwargs)]
+
+async def astrout(cmd, **kwargs):
+    """Same as ``aiterout()`` but returns a string."""
+    return "\n".join(await alistout(cmd, **kwargs))
+
+##--------------------------------------------------------------#
+## Stderr related functions.                                    #
+##--------------------------------------------------------------#
+
+#: Async iterator through lines of stderr.
+aitererr = functools.partial(aiterstd, std="err")
+
+async def alisterr(cmd, **kwargs):
+    """Same as ``aitererr()`` but returns a list."""
+    return [line async for line in aitererr(cmd, **kwargs)]
+
+async def astrerr(cmd, **kwargs):
+    """Same as ``aitererr()`` but returns a string."""
+    return "\n".join(await alisterr(cmd, **kwargs))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    pass
@@ -4,17 +4,53 @@
 ## SECTION: Imports                                             #
 ##==============================================================#
 
+from collections import namedtuple
 from datetime import datetime
 import atexit
+import binascii
 import codecs
+import fnmatch
+import gzip
 import hashlib
+import io
+import json
+import mmap
 import os
 import os.path as op
+import re
+import select
 import shutil
+import stat
+import struct
 import sys
+import threading
+import time
+import weakref
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+try:
+    from concurrent import futures
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import ctypes
+    import ctypes.util
+except ImportError:
+    ctypes = None
 
 import top as auxly
-from stringy import haspattern, subtract
+from listy import iterate
+from stringy import subtract
 
 ##==============================================================#
 ## SECTION: Global Definitions                                  #
@@ -23,10 +59,84 @@ from stringy import haspattern, subtract
 #: Default file encoding.
 ENCODING = "utf-8"
 
+#: Default block size in bytes used when reading files for checksums.
+BLOCKSIZE = 0x100000
+
+#: True if files can be listed and deleted relative to a directory descriptor.
+_DIRFD = (os.scandir in getattr(os, "supports_fd", ()) and
+        os.unlink in getattr(os, "supports_dir_fd", ())) if hasattr(os, "scandir") else False
+
+#: Flags used to open directory descriptors.
+_DIRFLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+#: Monotonic clock used for progress rates.
+_clock = getattr(time, "monotonic", time.time)
+
+#: Linux ioctl request for cloning (reflinking) a file.
+_FICLONE = 0x40049409
+
+#: Error raised when copying a file onto itself.
+_SameFileError = getattr(shutil, "SameFileError", shutil.Error)
+
+#: Size in bytes of the first/last blocks compared by ``duplicates()``.
+_EDGESIZE = 0x1000
+
+#: Per-thread read buffers used for checksums.
+_buffers = threading.local()
+
+#: Version of the ``Snapshot`` index file format.
+_SNAPSHOT_VERSION = 1
+
+#: Characters that make a glob pattern more than a literal name.
+_GLOBCHARS = re.compile(r"[*?[]")
+
+#: Size in bytes of the blocks read backwards by ``File.tail()``.
+_TAILSIZE = 0x2000
+
+#: Inotify event flags (see ``inotify(7)``).
+_IN_MODIFY = 0x2
+_IN_ATTRIB = 0x4
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ONLYDIR = 0x1000000
+_IN_ISDIR = 0x40000000
+
+#: Header of an inotify event; the name follows it.
+_IN_EVENT = struct.Struct("iIII")
+
 ##==============================================================#
 ## SECTION: Class Definitions                                   #
 ##==============================================================#
 
+#: Statistics for a directory tree as returned by ``treestats()``; includes
+#: the number of files, directories, total file size in bytes, symlinks, and
+#: entries that could not be read.
+TreeStats = namedtuple("TreeStats", "files dirs size symlinks errors")
+
+#: Changes found by ``Snapshot.scan()``; each is a list of absolute paths.
+SnapshotDiff = namedtuple("SnapshotDiff", "added removed modified")
+
+#: Status given to ``Progress`` callbacks; includes the number of files and
+#: bytes done, the current path and the rate in bytes per second since the
+#: previous callback.
+ProgressStatus = namedtuple("ProgressStatus", "files bytes path rate")
+
+#: Result of ``sync()``; each is a list of destination paths that were copied,
+#: deleted or could not be updated.
+SyncResult = namedtuple("SyncResult", "copied deleted failed")
+
+#: Change yielded by ``watch()``; the kind is `created`, `modified` or
+#: `deleted` and the path is absolute. The kind is `overflow` (with the watched
+#: directory as the path) if changes were lost and the tree should be
+#: rescanned.
+WatchEvent = namedtuple("WatchEvent", "kind path")
+
 class Cwd(object):
     """Class to handle changing current working directory. Can
     be used as a context manager.
@@ -63,11 +173,23 @@ class Cwd(object):
         return self.path
 
 class Path(str):
-    """Object representing a file system path."""
+    """Object representing a file system path. The stat result for the path is
+    fetched lazily and cached; use ``refresh()`` to discard it."""
     def __new__(cls, path, *extrapath, **kwargs):
         return super(Path, cls).__new__(cls, op.abspath(op.join(path, *extrapath)))
-    def __init__(self, *path):
-        self._fspath = op.abspath(op.join(*path))
+    def __init__(self, *path, **kwargs):
+        self._fspath = str.__str__(self)
+        self._stat = None
+        self._entry = None
+    @classmethod
+    def _fromentry(cls, entry):
+        """Returns an object for the given ``os.DirEntry`` without accessing the
+        file system. The entry seeds the stat cache."""
+        obj = super(Path, cls).__new__(cls, entry.path)
+        obj._fspath = entry.path
+        obj._stat = None
+        obj._entry = entry
+        return obj
     def __add__(self, value):
         return Path(self._fspath + value)
     def __sub__(self, value):
@@ -90,49 +212,77 @@ class Path(str):
         """Returns a ``Path`` of the given relative path joined with this
         object."""
         return Path(self, relpath)
+    def stat(self, refresh=False):
+        """Returns the ``os.stat()`` result for the path or None if it does not
+        exist. The result is cached after the first call unless `refresh` is
+        true."""
+        if refresh or self._stat is None:
+            try:
+                if self._entry and not refresh:
+                    self._stat = self._entry.stat()
+                else:
+                    self._stat = os.stat(self._fspath)
+            except OSError:
+                self._stat = False
+            self._entry = None
+        return self._stat or None
+    def refresh(self):
+        """Discards the cached stat result so it is fetched again on next
+        use."""
+        self._stat = None
+        self._entry = None
     def exists(self):
         """Returns true if object exists, otherwise false."""
-        return op.exists(self._fspath)
+        return self.stat(refresh=True) is not None
     def isdir(self):
         """Returns true if path is for an existing directory, otherwise false."""
-        return op.isdir(self._fspath)
+        st = self.stat(refresh=True)
+        return st is not None and stat.S_ISDIR(st.st_mode)
     def isfile(self):
         """Returns true if path is for an existing file, otherwise false."""
-        return op.isfile(self._fspath)
+        st = self.stat(refresh=True)
+        return st is not None and stat.S_ISREG(st.st_mode)
     def isempty(self):
         """Returns true if object is empty, otherwise false."""
         return isempty(self._fspath)
     def created(self):
         """Returns the object created date/time."""
-        if not self.exists():
+        st = self.stat()
+        if not st:
             return None
         try:
-            return datetime.fromtimestamp(op.getctime(self._fspath))
+            return datetime.fromtimestamp(st.st_ctime)
         except Exception as ex:
             return auxly.AuxlyError(ex)
     def modified(self):
         """Returns the object modified date/time."""
-        if not self.exists():
+        st = self.stat()
+        if not st:
             return None
         try:
-            return datetime.fromtimestamp(op.getmtime(self._fspath))
+            return datetime.fromtimestamp(st.st_mtime)
         except Exception as ex:
             return auxly.AuxlyError(ex)
     def size(self):
         """Returns the size of the object in bytes."""
-        if not self.exists():
+        st = self.stat()
+        if not st:
             return None
         try:
-            return getsize(self._fspath, recurse=False)
+            if stat.S_ISDIR(st.st_mode):
+                return getsize(self._fspath, recurse=False)
+            return st.st_size
         except Exception as ex:
             return auxly.AuxlyError(ex)
-    def delete(self):
+    def delete(self, **kwargs):
         """Deletes the file. Returns true if successful, otherwise false."""
-        return delete(self)
-    def copy(self, dstpath):
-        return copy(self._fspath, dstpath)
-    def move(self, dstpath):
-        return move(self._fspath, dstpath)
+        self.refresh()
+        return delete(self, **kwargs)
+    def copy(self, dstpath, **kwargs):
+        return copy(self._fspath, dstpath, **kwargs)
+    def move(self, dstpath, **kwargs):
+        self.refresh()
+        return move(self._fspath, dstpath, **kwargs)
 
 class Dir(Path):
     """Object representing a file system directory."""
@@ -152,12 +302,15 @@ class Dir(Path):
         if isinstance(path, Path):
             path = path._fspath
         super(Dir, self).__init__(path, *extrapath)
-        if self.exists() and self.isfile():
+        st = self.stat()
+        if st and stat.S_ISREG(st.st_mode):
             raise TypeError("dir cannot be file")
         if kwargs.get('make'):
             self.make()
         if kwargs.get('del_at_exit'):
             atexit.register(self.delete)
+    def treestats(self, **kwargs):
+        return treestats(self, **kwargs)
     def countall(self, **kwargs):
         return countall(self, **kwargs)
     def countfiles(self, **kwargs):
@@ -165,17 +318,27 @@ class Dir(Path):
     def countdirs(self, **kwargs):
         return countdirs(self, **kwargs)
     def walkall(self, **kwargs):
-        for i in walkall(self, **kwargs):
-            yield i
+        return walkall(self, **kwargs)
     def walkfiles(self, **kwargs):
-        for i in walkfiles(self, **kwargs):
-            yield i
+        return walkfiles(self, **kwargs)
     def walkdirs(self, **kwargs):
-        for i in walkdirs(self, **kwargs):
-            yield i
+        return walkdirs(self, **kwargs)
+    def duplicates(self, **kwargs):
+        return duplicates(self, **kwargs)
+    def grep(self, pattern, **kwargs):
+        return grep(self, pattern, **kwargs)
+    def watch(self, **kwargs):
+        return watch(self, **kwargs)
+    def sync(self, dstdir, **kwargs):
+        return sync(self, dstdir, **kwargs)
+    def snapshot(self, indexpath=None):
+        """Returns a ``Snapshot`` of this directory, loaded from the given index
+        file path if it exists."""
+        return Snapshot(self, indexpath)
     def make(self):
         """Creates the directory if it does not already exist. No effect if the
         directory already exists."""
+        self.refresh()
         return makedirs(self, ignore_extsep=True)
 
 class File(Path):
@@ -197,7 +360,8 @@ class File(Path):
         if isinstance(path, Path):
             path = path._fspath
         super(File, self).__init__(path, *extrapath)
-        if self.exists() and self.isdir():
+        st = self.stat()
+        if st and stat.S_ISDIR(st.st_mode):
             raise TypeError("file cannot be dir")
         if kwargs.get('make'):
             self.make()
@@ -239,8 +403,177 @@ class File(Path):
                 return fi.readlines()
         except Exception as ex:
             return auxly.AuxlyError(ex)
-    def _write(self, content, mode, encoding=None, linesep=False):
+    def iterlines(self, encoding=None, keepends=False):
+        """Yields the lines of the file one at a time without reading the whole
+        file into memory. Line endings are removed unless `keepends` is true.
+        Yields nothing if the file does not exist; if an error occurs, an
+        AuxlyError is yielded as the final item."""
+        if not self.exists():
+            return
+        try:
+            encoding = encoding or ENCODING
+            with io.open(self._fspath, encoding=encoding, newline="") as fi:
+                for line in fi:
+                    yield (line if keepends else line.rstrip("\r\n"))
+        except Exception as ex:
+            yield auxly.AuxlyError(ex)
+    def iterchunks(self, size=0x10000, binary=False, encoding=None):
+        """Yields the content of the file in chunks of the given size (in
+        characters, or bytes if `binary` is true) without reading the whole
+        file into memory. Yields nothing if the file does not exist; if an
+        error occurs, an AuxlyError is yielded as the final item."""
+        if not self.exists():
+            return
+        try:
+            if binary:
+                fi = io.open(self._fspath, "rb")
+            else:
+                fi = io.open(self._fspath, encoding=encoding or ENCODING, newline="")
+            with fi:
+                while True:
+                    chunk = fi.read(size)
+                    if not chunk:
+                        break
+                    yield chunk
+        except Exception as ex:
+            yield auxly.AuxlyError(ex)
+    def tail(self, lines=10, encoding=None):
+        """Returns a list of the last lines of the file without reading the
+        whole file; the file is read backwards from the end in blocks. Line
+        endings are removed. Returns an empty list if the file does not exist.
+
+        **Examples**:
+        ::
+            auxly.filesys.File("app.log").tail(20)
+        """
+        if lines <= 0 or not self.exists():
+            return []
+        try:
+            encoding = encoding or ENCODING
+            with io.open(self._fspath, "rb") as fi:
+                found, rest = _tailsplit(fi, os.fstat(fi.fileno()).st_size, lines)
+            if rest:
+                found.append(rest)
+            return [_decodeline(line, encoding) for line in found[-lines:]]
+        except Exception as ex:
+            return auxly.AuxlyError(ex)
+    def follow(self, lines=0, encoding=None, interval=0.1, maxinterval=1.0, timeout=None):
+        """Yields the last given number of lines of the file, then yields new
+        lines as they are appended, similar to ``tail -F``. Only complete
+        lines are yielded and line endings are removed. The file may be
+        missing at first; truncation and rotation (the path being replaced
+        by a new file) are detected and the new content is followed from
+        its start. On Linux, inotify is used to wait for changes; elsewhere
+        the file is polled, starting at `interval` seconds and backing off
+        up to `maxinterval` seconds while nothing changes. If `timeout` is
+        given, the generator stops once no line has arrived for that many
+        seconds. If an error occurs, an AuxlyError is yielded as the final
+        item.
+
+        **Examples**:
+        ::
+            for line in auxly.filesys.File("app.log").follow(lines=10):
+                print(line)
+        """
+        encoding = encoding or ENCODING
+        fi = None
+        notify = None
+        pending = b""
+        offset = 0
+        try:
+            fi = _openfollow(self._fspath)
+            if fi:
+                offset = os.fstat(fi.fileno()).st_size
+                found, pending = _tailsplit(fi, offset, lines)
+                for line in found:
+                    yield _decodeline(line, encoding)
+            if _Inotify.available():
+                notify = _Inotify()
+                try:
+                    notify.add(op.dirname(self._fspath), _IN_MODIFY | _IN_ATTRIB |
+                            _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO)
+                except OSError:
+                    # NOTE: The directory is missing or cannot be watched;
+                    # fall back to polling.
+                    notify.close()
+                    notify = None
+            delay = interval
+            last = _clock()
+            while True:
+                got = False
+                if fi is None:
+                    fi = _openfollow(self._fspath)
+                    offset = 0
+                if fi:
+                    st = os.fstat(fi.fileno())
+                    if st.st_size < offset:
+                        # NOTE: Truncated in place; follow from the start.
+                        if pending:
+                            yield _decodeline(pending, encoding)
+                        offset = 0
+                        pending = b""
+                    fi.seek(offset)
+                    while True:
+                        chunk = fi.read(BLOCKSIZE)
+                        if not chunk:
+                            break
+                        offset += len(chunk)
+                        parts = (pending + chunk).split(b"\n")
+                        pending = parts.pop()
+                        for part in parts:
+                            got = True
+                            yield _decodeline(part, encoding)
+                    if _rotated(self._fspath, st):
+                        # NOTE: Everything written to the old file has been
+                        # read; switch over to the new one.
+                        if pending:
+                            got = True
+                            yield _decodeline(pending, encoding)
+                        fi.close()
+                        fi = None
+                        pending = b""
+                        continue
+                now = _clock()
+                if got:
+                    delay = interval
+                    last = now
+                    continue
+                wait = maxinterval if notify else delay
+                if timeout is not None:
+                    if now - last >= timeout:
+                        return
+                    wait = min(wait, timeout - (now - last))
+                if notify:
+                    if notify.wait(wait):
+                        notify.read()
+                else:
+                    time.sleep(wait)
+                    delay = min(delay * 2, maxinterval)
+        except Exception as ex:
+            yield auxly.AuxlyError(ex)
+        finally:
+            if fi:
+                fi.close()
+            if notify:
+                notify.close()
+    def mmap(self):
+        """Returns a context manager that maps the file read-only into memory.
+        The mapped content can be searched with bytes regex patterns and, on
+        Python 3, wrapped in a ``memoryview()`` for slicing without copying;
+        such views must be released before the context exits (Python 2 maps
+        do not support ``memoryview()``, and slicing them copies). Empty files
+        give an empty bytes object. Gives None if the file does not exist or
+        an AuxlyError if it cannot be mapped.
+
+        **Examples**:
+        ::
+            with auxly.filesys.File("foo.bin").mmap() as data:
+                re.search(b"needle", data)
+        """
+        return _FileMap(self._fspath)
+    def _write(self, content, mode, encoding=None, linesep=False, ifchanged=False):
         """Handles file writes."""
+        self.refresh()
         makedirs(self)
         try:
             encoding = encoding or ENCODING
@@ -251,6 +584,14 @@ class File(Path):
                     pass
                 if linesep:
                     content += os.linesep
+            if ifchanged:
+                data = content if "b" in mode else content.encode(encoding)
+                if _samecontent(self._fspath, data):
+                    return False
+            if "b" in mode:
+                with io.open(self._fspath, mode) as fo:
+                    fo.write(content)
+                    return True
             with codecs.open(self, mode, encoding=encoding) as fo:
                 fo.write(content)
                 return True
@@ -265,20 +606,44 @@ class File(Path):
         """Same as `append()` but adds a line break after the content."""
         mode = "ab" if binary else "a"
         return self._write(content, mode, encoding=encoding, linesep=True)
-    def write(self, content, binary=False, encoding=None):
+    def write(self, content, binary=False, encoding=None, ifchanged=False):
         """Writes the given content to the file. Existing content is
-        deleted. Returns true if successful, otherwise false."""
+        deleted. Returns true if successful, otherwise false. If `ifchanged`
+        is true, the file is left untouched (and false is returned) when it
+        already holds the given content."""
         mode = "wb" if binary else "w"
-        return self._write(content, mode, encoding=encoding, linesep=False)
-    def writeline(self, content, binary=False, encoding=None):
+        return self._write(content, mode, encoding=encoding, linesep=False, ifchanged=ifchanged)
+    def writeline(self, content, binary=False, encoding=None, ifchanged=False):
         """Same as `write()` but adds a line break after the content."""
         mode = "wb" if binary else "w"
-        return self._write(content, mode, encoding=encoding, linesep=True)
+        return self._write(content, mode, encoding=encoding, linesep=True, ifchanged=ifchanged)
+    def writer(self, binary=False, encoding=None, **kwargs):
+        """Returns a ``FileWriter`` for writing to the file through a single
+        buffered handle. Existing content is deleted. Accepts the `buffersize`,
+        `flushinterval` and `fsync` keyword arguments of ``FileWriter``.
+
+        **Examples**:
+        ::
+            with auxly.filesys.File("foo.txt").writer() as fw:
+                fw.writeline("hello")
+        """
+        return FileWriter(self, "wb" if binary else "w", encoding=encoding, **kwargs)
+    def appender(self, binary=False, encoding=None, **kwargs):
+        """Same as ``writer()`` but existing content is preserved.
+
+        **Examples**:
+        ::
+            with auxly.filesys.File("foo.log").appender(flushinterval=1) as log:
+                for msg in messages:
+                    log.appendline(msg)
+        """
+        return FileWriter(self, "ab" if binary else "a", encoding=encoding, **kwargs)
     def empty(self):
         """Erases/empties the content in a file but does not delete it."""
         return self.write("")
     def checksum(self, **kwargs):
-        """Returns the checksum of the file."""
+        """Returns the checksum of the file. Accepts the same keyword arguments
+        as ``checksum()``, e.g. `hasher` and `blocksize`."""
         return checksum(self, **kwargs)
     def make(self):
         """Creates an empty file If the file does not already exist. No effect
@@ -287,6 +652,728 @@ class File(Path):
             return True
         return self.empty()
 
+class FileWriter(object):
+    """Buffered writer returned by ``File.writer()`` and ``File.appender()``.
+    The file is kept open so repeated writes do not each open and close it.
+    Can be used as a context manager."""
+    def __init__(self, path, mode="a", encoding=None, buffersize=0x10000,
+            flushinterval=None, fsync=None):
+        """Writer for the given file path.
+
+        **Params:**
+          - path (str) - Path to the file.
+          - mode (str) - File mode; `w`/`a` optionally followed by `b`.
+          - encoding (str) - Text encoding; the ENCODING variable by default.
+          - buffersize (int) - Size of the write buffer in bytes.
+          - flushinterval (float) - If given, buffered content is flushed at
+            most this many seconds after it was written, by a background timer
+            if no later write or close does it first.
+          - fsync (str) - If `flush`, the file is synced to disk on every
+            flush; if `close`, only when closed.
+        """
+        #: The file path.
+        self.path = path._fspath if isinstance(path, Path) else op.abspath(path)
+        #: Minimum seconds between automatic flushes.
+        self.flushinterval = flushinterval
+        #: The fsync policy.
+        self.fsync = fsync
+        self._target = path
+        self._binary = "b" in mode
+        self._file = None
+        self._error = None
+        self._lastflush = _clock()
+        self._lock = threading.RLock()
+        self._timer = None
+        makedirs(self.path)
+        try:
+            if self._binary:
+                self._file = io.open(self.path, mode, buffering=buffersize)
+            else:
+                self._file = codecs.open(self.path, mode, encoding=encoding or ENCODING, buffering=buffersize)
+        except Exception as ex:
+            self._error = auxly.AuxlyError(ex)
+        self._refresh()
+    def __enter__(self):
+        return self
+    def __exit__(self, type, value, traceback):
+        self.close()
+    def __repr__(self):
+        return "FileWriter: " + self.path
+    def write(self, content):
+        """Writes the given content. Returns true if successful, otherwise
+        false."""
+        if not self._binary:
+            try:
+                content = str(content)
+            except Exception:
+                pass
+        with self._lock:
+            if self._file is None:
+                return self._error or False
+            try:
+                self._file.write(content)
+                if self.flushinterval is not None:
+                    wait = self.flushinterval - (_clock() - self._lastflush)
+                    if wait <= 0:
+                        self._flush()
+                    elif self._timer is None:
+                        self._timer = threading.Timer(wait, self._timedflush)
+                        self._timer.daemon = True
+                        self._timer.start()
+                return True
+            except Exception as ex:
+                return auxly.AuxlyError(ex)
+    def writeline(self, content):
+        """Same as ``write()`` but adds a line break after the content."""
+        if self._binary:
+            return self.write(content + os.linesep.encode("ascii"))
+        try:
+            content = str(content)
+        except Exception:
+            pass
+        return self.write(content + os.linesep)
+    #: Same as ``write()``.
+    append = write
+    #: Same as ``writeline()``.
+    appendline = writeline
+    def flush(self):
+        """Writes any buffered content to the file. Returns true if successful,
+        otherwise false."""
+        with self._lock:
+            if self._file is None:
+                return self._error or False
+            try:
+                self._flush()
+                return True
+            except Exception as ex:
+                return auxly.AuxlyError(ex)
+    def close(self):
+        """Flushes and closes the file. Returns true if successful, otherwise
+        false."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._file is None:
+                return self._error or False
+            try:
+                self._file.flush()
+                if self.fsync in ("flush", "close"):
+                    os.fsync(self._file.fileno())
+                return True
+            except Exception as ex:
+                return auxly.AuxlyError(ex)
+            finally:
+                self._file.close()
+                self._file = None
+                self._refresh()
+    def _timedflush(self):
+        """Called by the flush timer."""
+        with self._lock:
+            self._timer = None
+            if self._file is None:
+                return
+            try:
+                self._flush()
+            except Exception:
+                pass
+    def _flush(self):
+        self._file.flush()
+        if "flush" == self.fsync:
+            os.fsync(self._file.fileno())
+        self._lastflush = _clock()
+        self._refresh()
+    def _refresh(self):
+        if isinstance(self._target, Path):
+            self._target.refresh()
+
+class PathFilter(object):
+    """Reusable path filter that can be passed as the `regex` argument of the
+    walk functions and ``delete()``. All patterns are compiled once when the
+    filter is created and, when matching, the cheapest checks are evaluated
+    first so the regex is only searched if everything else passes.
+
+    **Params:**
+      - regex (str) - Regex pattern searched for in the entire path, or in the
+        name only if `entire` is false.
+      - glob (str|list) - One or more fnmatch-style patterns; the name must
+        match at least one of them.
+      - ext (str|list) - One or more extensions (e.g. `.py`); the name must
+        end with one of them.
+      - exclude (str|list) - One or more fnmatch-style patterns; names that
+        match are rejected and matching directories are not recursed into.
+      - entire (bool) - If true, `regex` is matched against the entire path.
+
+    **Examples**:
+    ::
+        pf = auxly.filesys.PathFilter(ext=".py", exclude=[".git", "__pycache__"])
+        for f in auxly.filesys.walkfiles("src", pf, recurse=True):
+            pass
+    """
+    def __init__(self, regex=None, glob=None, ext=None, exclude=None, entire=True):
+        #: If true, the regex is matched against the entire path.
+        self.entire = entire
+        self._regex = re.compile(regex) if regex else None
+        self._exts = tuple(
+                op.normcase(e if e.startswith(os.extsep) else os.extsep + e)
+                for e in iterate(ext or []))
+        self._globnames, self._globs = _compileglobs(glob)
+        self._exclnames, self._excls = _compileglobs(exclude)
+    def match(self, path, name=None):
+        """Returns true if the given path passes the filter, otherwise false.
+        The name is derived from the path if not provided."""
+        if name is None:
+            name = op.basename(path)
+        ncname = op.normcase(name)
+        if self._exts and not ncname.endswith(self._exts):
+            return False
+        if self._globnames or self._globs:
+            if not _matchglobs(ncname, self._globnames, self._globs):
+                return False
+        if self._exclnames or self._excls:
+            if _matchglobs(ncname, self._exclnames, self._excls):
+                return False
+        if self._regex:
+            return self._regex.search(path if self.entire else name) != None
+        return True
+    def excludes(self, name):
+        """Returns true if the given name matches an exclude pattern."""
+        if not (self._exclnames or self._excls):
+            return False
+        return _matchglobs(op.normcase(name), self._exclnames, self._excls)
+
+class ChecksumCache(object):
+    """Persistent cache of file checksums backed by a SQLite database. Entries
+    are keyed by the file path, size, modification time, inode and hash
+    algorithm so a cached checksum is only used while the file is unchanged.
+    The least recently used entries are evicted once `maxsize` is exceeded.
+    Can be used as a context manager.
+
+    **Examples**:
+    ::
+        with auxly.filesys.ChecksumCache("checksums.db") as cache:
+            auxly.filesys.checksum("foo.bin", cache=cache)
+    """
+    def __init__(self, path=None, maxsize=100000):
+        """Checksum cache stored at the given database path. The cache is kept
+        in memory only if no path is given."""
+        #: The database path.
+        self.path = op.abspath(path) if path else ":memory:"
+        #: Maximum number of cached checksums.
+        self.maxsize = maxsize
+        if path:
+            makedirs(self.path)
+        # NOTE: Imported here so the module works on Python builds without
+        # SQLite support as long as no cache is used.
+        import sqlite3
+        self._binary = sqlite3.Binary
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("""CREATE TABLE IF NOT EXISTS checksums (
+                path TEXT, algorithm TEXT, size INTEGER, mtime INTEGER,
+                inode INTEGER, digest BLOB, used INTEGER,
+                PRIMARY KEY (path, algorithm))""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS checksums_used ON checksums (used)")
+        self._count, self._used = self._db.execute(
+                "SELECT COUNT(*), COALESCE(MAX(used), 0) FROM checksums").fetchone()
+        self._writes = 0
+        # NOTE: Only a weak reference is registered so that the cache can
+        # still be garbage collected before exit.
+        atexit.register(_closeref, weakref.ref(self))
+    def __del__(self):
+        self.close()
+    def __enter__(self):
+        return self
+    def __exit__(self, type, value, traceback):
+        self.close()
+    def __len__(self):
+        return self._count
+    def __repr__(self):
+        return "ChecksumCache: " + self.path
+    def get(self, fpath, algorithm, st=None):
+        """Returns the cached digest bytes for the given file path and
+        algorithm if the file is unchanged, otherwise None."""
+        fpath = op.abspath(fpath)
+        st = st or os.stat(fpath)
+        with self._lock:
+            if not self._db:
+                return None
+            row = self._db.execute(
+                    "SELECT size, mtime, inode, digest FROM checksums WHERE path=? AND algorithm=?",
+                    (fpath, algorithm)).fetchone()
+            if not row or tuple(row[:3]) != (st.st_size, _mtimens(st), st.st_ino):
+                return None
+            self._used += 1
+            self._db.execute("UPDATE checksums SET used=? WHERE path=? AND algorithm=?",
+                    (self._used, fpath, algorithm))
+            self._wrote()
+            return bytes(row[3])
+    def put(self, fpath, algorithm, digest, st=None):
+        """Caches the given digest bytes for the given file path and
+        algorithm."""
+        fpath = op.abspath(fpath)
+        st = st or os.stat(fpath)
+        with self._lock:
+            if not self._db:
+                return
+            self._used += 1
+            cur = self._db.execute("UPDATE checksums SET size=?, mtime=?, inode=?, digest=?, used=? WHERE path=? AND algorithm=?",
+                    (st.st_size, _mtimens(st), st.st_ino, self._binary(digest), self._used, fpath, algorithm))
+            if not cur.rowcount:
+                self._db.execute("INSERT INTO checksums VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (fpath, algorithm, st.st_size, _mtimens(st), st.st_ino, self._binary(digest), self._used))
+                self._count += 1
+                if self._count > self.maxsize:
+                    excess = self._count - self.maxsize
+                    self._db.execute("DELETE FROM checksums WHERE rowid IN (SELECT rowid FROM checksums ORDER BY used LIMIT ?)", (excess,))
+                    self._count -= excess
+            self._wrote()
+    def clear(self):
+        """Removes all cached checksums."""
+        with self._lock:
+            if self._db:
+                self._db.execute("DELETE FROM checksums")
+                self._db.commit()
+                self._count = 0
+    def close(self):
+        """Saves any pending changes and closes the database."""
+        if getattr(self, "_db", None) is None:
+            return
+        with self._lock:
+            if self._db:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+    def _wrote(self):
+        """Commits changes periodically rather than on every write."""
+        self._writes += 1
+        if self._writes >= 100:
+            self._db.commit()
+            self._writes = 0
+
+class Progress(object):
+    """Throttled progress reporting for long running operations such as
+    ``copy()``, ``move()``, ``delete()`` and ``checksum()``. The callback is
+    given a ``ProgressStatus`` at most once per `interval` seconds and once more
+    when the operation finishes. Those functions also accept a plain callback,
+    which is wrapped in a new ``Progress``; pass the same ``Progress`` to
+    several calls to report combined totals.
+
+    **Examples**:
+    ::
+        def show(status):
+            print(status.files, status.bytes, status.rate)
+        auxly.filesys.copy("foo", "bar", progress=show)
+    """
+    def __init__(self, callback, interval=0.5):
+        #: Function called with a ``ProgressStatus``.
+        self.callback = callback
+        #: Minimum number of seconds between callbacks.
+        self.interval = interval
+        #: Number of files done so far.
+        self.files = 0
+        #: Number of bytes done so far.
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._last = _clock()
+        self._lastbytes = 0
+    def update(self, path, nbytes=0, files=0):
+        """Adds the given number of bytes and files done for the given path.
+        Calls the callback if the interval has elapsed."""
+        with self._lock:
+            self.bytes += nbytes
+            self.files += files
+            now = _clock()
+            if now - self._last < self.interval:
+                return
+            status = self._status(path, now)
+        self.callback(status)
+    def report(self, path=None):
+        """Calls the callback regardless of the interval."""
+        with self._lock:
+            status = self._status(path, _clock())
+        self.callback(status)
+    def _status(self, path, now):
+        elapsed = now - self._last
+        rate = (self.bytes - self._lastbytes) / elapsed if elapsed > 0 else 0.0
+        self._last = now
+        self._lastbytes = self.bytes
+        return ProgressStatus(self.files, self.bytes, path, rate)
+
+class Snapshot(object):
+    """Index of the entries within a directory tree that can be saved to disk
+    and later rescanned to find what changed. On rescans, only directories
+    whose own modification time changed are listed again; the cached listing
+    is reused for all others.
+
+    **Examples**:
+    ::
+        snap = auxly.filesys.Snapshot("foo", "foo.snap")
+        changes = snap.scan()  # Saved to `foo.snap` after each scan.
+        changes.added, changes.removed, changes.modified
+    """
+    def __init__(self, path, indexpath=None):
+        """Snapshot of the given directory path.
+
+        **Params:**
+          - path (str) - Path to the directory.
+          - indexpath (str) - Optional path to the index file. If the file
+            exists, the previous snapshot is loaded from it.
+        """
+        #: The snapshot directory path.
+        self.path = op.abspath(path)
+        #: The index file path.
+        self.indexpath = op.abspath(indexpath) if indexpath else None
+        self._dirs = {}
+        if self.indexpath:
+            self.load()
+    def __len__(self):
+        return sum(len(entries) for _, entries in self._dirs.values())
+    def __repr__(self):
+        return "Snapshot: " + self.path
+    def load(self):
+        """Loads the snapshot from the index file. Returns true if successful,
+        otherwise false."""
+        if not self.indexpath or not op.isfile(self.indexpath):
+            return False
+        try:
+            with gzip.open(self.indexpath, "rb") as fi:
+                data = json.loads(fi.read().decode("utf-8"))
+            if data.get('version') != _SNAPSHOT_VERSION or data.get('path') != self.path:
+                return False
+            self._dirs = data['dirs']
+            return True
+        except Exception as ex:
+            return auxly.AuxlyError(ex)
+    def save(self):
+        """Saves the snapshot to the index file. Returns true if successful,
+        otherwise false."""
+        if not self.indexpath:
+            return False
+        makedirs(self.indexpath)
+        tmppath = self.indexpath + ".tmp"
+        try:
+            data = {'version': _SNAPSHOT_VERSION, 'path': self.path, 'dirs': self._dirs}
+            with gzip.open(tmppath, "wb") as fo:
+                fo.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            if op.exists(self.indexpath):
+                os.remove(self.indexpath)
+            os.rename(tmppath, self.indexpath)
+            return True
+        except Exception as ex:
+            return auxly.AuxlyError(ex)
+    def scan(self, checkfiles=False, save=True):
+        """Rescans the directory tree and returns a ``SnapshotDiff`` of the
+        absolute paths added, removed and modified since the last scan. Files
+        within unchanged directories are only checked for modification if
+        `checkfiles` is true, since editing a file in place does not change
+        the modification time of its directory. The index file is updated if
+        `save` is true."""
+        added = []
+        removed = []
+        modified = []
+        newdirs = {}
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            dirpath = op.join(self.path, rel) if rel else self.path
+            try:
+                mtime = _mtimens(os.stat(dirpath))
+            except OSError:
+                continue
+            old = self._dirs.get(rel)
+            if old and old[0] == mtime:
+                entries = old[1]
+                if checkfiles:
+                    for name, record in entries.items():
+                        if record[0]:
+                            continue
+                        try:
+                            new = _snaprecord(os.lstat(op.join(dirpath, name)))
+                        except OSError:
+                            continue
+                        if new != record:
+                            entries[name] = new
+                            modified.append(op.join(dirpath, name))
+            else:
+                entries = {}
+                try:
+                    for entry in _scandir(dirpath):
+                        entries[entry.name] = _snaprecord(entry.stat(follow_symlinks=False))
+                except OSError:
+                    pass
+                oldentries = old[1] if old else {}
+                for name, record in entries.items():
+                    oldrecord = oldentries.get(name)
+                    if oldrecord is None:
+                        added.append(op.join(dirpath, name))
+                    elif oldrecord[0] != record[0]:
+                        removed.append(op.join(dirpath, name))
+                        added.append(op.join(dirpath, name))
+                    elif not record[0] and oldrecord != record:
+                        modified.append(op.join(dirpath, name))
+                for name in oldentries:
+                    if name not in entries:
+                        removed.append(op.join(dirpath, name))
+            newdirs[rel] = [mtime, entries]
+            for name, record in entries.items():
+                if record[0]:
+                    stack.append(op.join(rel, name))
+        for rel, (_, entries) in self._dirs.items():
+            if rel not in newdirs:
+                dirpath = op.join(self.path, rel) if rel else self.path
+                removed.extend(op.join(dirpath, name) for name in entries)
+        self._dirs = newdirs
+        if save:
+            self.save()
+        return SnapshotDiff(added, removed, modified)
+
+class _FileMap(object):
+    """Context manager returned by ``File.mmap()``. If `strict` is true, errors
+    are raised rather than returned."""
+    def __init__(self, path, strict=False):
+        self._path = path
+        self._strict = strict
+        self._file = None
+        self._map = None
+    def __enter__(self):
+        if not self._strict and not op.isfile(self._path):
+            return None
+        try:
+            self._file = io.open(self._path, "rb")
+            if 0 == os.fstat(self._file.fileno()).st_size:
+                return b""
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map
+        except Exception as ex:
+            self._close()
+            if self._strict:
+                raise
+            return auxly.AuxlyError(ex)
+    def __exit__(self, type, value, traceback):
+        self._close()
+    def _close(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # NOTE: A memoryview of the map is still alive; the map will be
+                # closed once it is garbage collected.
+                pass
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class _Inotify(object):
+    """Minimal wrapper around the Linux inotify API using ctypes."""
+    _libc = None
+    @classmethod
+    def available(cls):
+        """Returns true if inotify can be used on this system."""
+        if cls._libc is None:
+            cls._libc = False
+            if ctypes and sys.platform.startswith("linux"):
+                try:
+                    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                    if hasattr(libc, "inotify_init1"):
+                        cls._libc = libc
+                except Exception:
+                    pass
+        return bool(cls._libc)
+    def __init__(self):
+        self.fd = self._check(self._libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0)))
+    def add(self, path, mask):
+        """Watches the given path; returns the watch descriptor."""
+        if not isinstance(path, bytes):
+            path = path.encode(sys.getfilesystemencoding())
+        return self._check(self._libc.inotify_add_watch(self.fd, path, mask))
+    def remove(self, wd):
+        """Stops watching the given watch descriptor."""
+        self._libc.inotify_rm_watch(self.fd, wd)
+    def wait(self, timeout=None):
+        """Returns true if events are ready to be read within the given number
+        of seconds."""
+        try:
+            return bool(select.select([self.fd], [], [], timeout)[0])
+        except (OSError, select.error):
+            return False
+    def read(self):
+        """Returns a list of (wd, mask, cookie, name) for the pending events."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 0x10000)
+            except OSError:
+                break
+            if not data:
+                break
+            pos = 0
+            while pos < len(data):
+                wd, mask, cookie, size = _IN_EVENT.unpack_from(data, pos)
+                pos += _IN_EVENT.size
+                name = data[pos:pos + size].rstrip(b"\0")
+                pos += size
+                events.append((wd, mask, cookie, name.decode(sys.getfilesystemencoding())))
+        return events
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+    def _check(self, result):
+        if result < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return result
+
+class _InotifyWatcher(object):
+    """Backend of ``watch()`` using an inotify watch on every directory."""
+    _MASK = (_IN_CREATE | _IN_DELETE | _IN_MODIFY | _IN_ATTRIB | _IN_MOVED_FROM |
+            _IN_MOVED_TO | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+    def __init__(self, path):
+        #: True once the watched directory itself is gone.
+        self.done = False
+        self._root = path
+        self._notify = _Inotify()
+        self._dirs = {}
+        try:
+            self._addtree(path, None, True)
+        except Exception:
+            self.close()
+            raise
+    def poll(self, timeout):
+        """Returns a list of (kind, path) changes, waiting up to the given
+        number of seconds (or indefinitely if None) for them."""
+        if not self._notify.wait(timeout):
+            return []
+        changes = []
+        for wd, mask, _, name in self._notify.read():
+            if mask & _IN_Q_OVERFLOW:
+                # NOTE: The kernel queue overflowed and events were lost; new
+                # directories may be unwatched so the watches are refreshed.
+                changes.append(("overflow", self._root))
+                self._addtree(self._root, None)
+                continue
+            if self._dirs.get(wd) == self._root and mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                changes.append(("deleted", self._root))
+                self.done = True
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            dirpath = self._dirs.get(wd)
+            if dirpath is None or not name:
+                continue
+            path = op.join(dirpath, name)
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                changes.append(("created", path))
+                if mask & _IN_ISDIR:
+                    self._addtree(path, changes)
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                changes.append(("deleted", path))
+                if mask & _IN_ISDIR:
+                    self._removetree(path)
+            elif not mask & _IN_ISDIR:
+                changes.append(("modified", path))
+        return changes
+    def close(self):
+        self._notify.close()
+    def _addtree(self, dirpath, changes, strict=False):
+        """Watches the given directory tree. If changes is a list, the entries
+        found are added to it as created, since they may have appeared before
+        the watches were in place. Errors are raised if `strict` is true."""
+        stack = [dirpath]
+        while stack:
+            cur = stack.pop()
+            try:
+                self._dirs[self._notify.add(cur, self._MASK)] = cur
+                entries = _scandir(cur)
+            except OSError:
+                if strict:
+                    raise
+                continue
+            for entry in entries:
+                if changes is not None:
+                    changes.append(("created", entry.path))
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    def _removetree(self, dirpath):
+        """Stops watching the given directory tree."""
+        prefix = op.join(dirpath, "")
+        for wd, path in list(self._dirs.items()):
+            if path == dirpath or path.startswith(prefix):
+                self._notify.remove(wd)
+                del self._dirs[wd]
+
+class _PollWatcher(object):
+    """Backend of ``watch()`` that periodically rescans a ``Snapshot``."""
+    def __init__(self, path, interval, checkfiles):
+        #: True once the watched directory itself is gone.
+        self.done = False
+        self._root = path
+        self._snap = Snapshot(path)
+        self._snap.scan(checkfiles, save=False)
+        self._interval = interval
+        self._checkfiles = checkfiles
+        self._next = _clock() + interval
+    def poll(self, timeout):
+        """Returns a list of (kind, path) changes, waiting up to the given
+        number of seconds (or until the next scan if None) for them."""
+        wait = self._next - _clock()
+        if timeout is not None:
+            wait = min(wait, timeout)
+        if wait > 0:
+            time.sleep(wait)
+        if _clock() < self._next:
+            return []
+        diff = self._snap.scan(self._checkfiles, save=False)
+        self._next = _clock() + self._interval
+        # NOTE: Removals come first so a path whose type changed coalesces
+        # into a modification.
+        changes = ([("deleted", p) for p in diff.removed] +
+                [("created", p) for p in diff.added] +
+                [("modified", p) for p in diff.modified])
+        if not op.isdir(self._root):
+            changes.append(("deleted", self._root))
+            self.done = True
+        return changes
+    def close(self):
+        pass
+
+class _DirEntry(object):
+    """Minimal stand-in for ``os.DirEntry`` used when ``os.scandir()`` is not
+    available. Stat results are cached the same way."""
+    def __init__(self, dirpath, name):
+        self.name = name
+        self.path = op.join(dirpath, name)
+        self._stat = None
+        self._lstat = None
+    def __repr__(self):
+        return "<_DirEntry %r>" % self.name
+    def stat(self, follow_symlinks=True):
+        if not follow_symlinks:
+            if self._lstat is None:
+                self._lstat = os.lstat(self.path)
+            return self._lstat
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+        return self._stat
+    def is_dir(self, follow_symlinks=True):
+        try:
+            return stat.S_ISDIR(self.stat(follow_symlinks).st_mode)
+        except OSError:
+            return False
+    def is_file(self, follow_symlinks=True):
+        try:
+            return stat.S_ISREG(self.stat(follow_symlinks).st_mode)
+        except OSError:
+            return False
+    def is_symlink(self):
+        try:
+            return stat.S_ISLNK(self.stat(False).st_mode)
+        except OSError:
+            return False
+
 ##==============================================================#
 ## SECTION: Function Definitions                                #
 ##==============================================================#
@@ -329,136 +1416,425 @@ def makedirs(path, ignore_extsep=False):
         return auxly.AuxlyError(ex)
     return True
 
-def delete(path, regex=None, recurse=False, test=False):
+def delete(path, regex=None, recurse=False, test=False, progress=None):
     """Deletes the file or directory at `path`. If `path` is a directory and
     `regex` is provided, matching files will be deleted; `recurse` controls
     whether subdirectories are recursed. A list of deleted items is returned.
     If `test` is true, nothing will be deleted and a list of items that would
-    have been deleted is returned.
+    have been deleted is returned. The `regex` is matched against file names
+    and may also be a ``PathFilter``. Progress is reported to the optional
+    `progress` callback or ``Progress``.
     """
     deleted = []
+    if regex:
+        try:
+            regex = _tofilter(regex, False)
+        except re.error:
+            return deleted
+    progress = _toprogress(progress)
     if op.isfile(path):
         if not test: os.remove(path)
-        else: return [path]
-        return [] if op.exists(path) else [path]
+        if test or not op.exists(path):
+            deleted = [path]
     elif op.isdir(path):
         if regex:
-            for r,ds,fs in os.walk(path):
-                for i in fs:
-                    if haspattern(regex, i):
-                        deleted += delete(op.join(r,i), test=test)
-                if not recurse:
-                    break
-        else:
-            if not test: shutil.rmtree(path)
-            else: return [path]
-            return [] if op.exists(path) else [path]
+            return list(iterdelete(path, regex, recurse, test, progress=progress))
+        if not test: shutil.rmtree(path)
+        if test or not op.exists(path):
+            deleted = [path]
+    if progress:
+        progress.update(path, files=len(deleted))
+        progress.report(path)
     return deleted
 
-def walkall(startdir, regex=None, regex_entire=True, recurse=False):
-    """Yields a ``File`` or ``Dir`` for all found files and directories within
-    the given start directory. Can optionally filter paths using a regex
-    pattern, either on the entire path if regex_entire is true otherwise on the
-    file name only."""
-    if not op.isdir(startdir):
-        return
-    for i in walkdirs(startdir, regex, regex_entire, recurse):
-        yield i
-    for i in walkfiles(startdir, regex, regex_entire, recurse):
-        yield i
+def iterdelete(path, regex=None, recurse=False, test=False, workers=None, progress=None):
+    """Deletes the files within the given directory, or only those matching the
+    given regex (or ``PathFilter``) if provided, and yields the path of each
+    file as it is deleted. Subdirectories are only handled if `recurse` is true
+    and are not deleted themselves. Files are unlinked relative to an open
+    directory descriptor where the platform supports it. If `workers` is
+    greater than one, directories are handled concurrently. If `test` is true,
+    nothing is deleted. If `path` is a file, only that file is deleted.
 
-def walkfiles(startdir, regex=None, regex_entire=True, recurse=False):
-    """Yields a ``File`` for files found within the given start
-    directory. Can optionally filter paths using a regex pattern, either on the
-    entire path if regex_entire is true otherwise on the file name only."""
-    if not op.isdir(startdir):
+    **Examples**:
+    ::
+        for path in auxly.filesys.iterdelete("cache", ".tmp$", recurse=True):
+            print("Deleted " + path)
+    """
+    try:
+        pfilter = _tofilter(regex, False)
+    except re.error:
         return
-    if sys.version_info >= (3, 6):
-        startdir = op.abspath(startdir)
-        with os.scandir(startdir) as it:
-            for i in it:
-                if i.is_file():
-                    if regex:
-                        path = op.join(startdir, i.name)
-                        n = path if regex_entire else i.name
-                        if haspattern(regex, n):
-                            yield File(path)
+    progress = _toprogress(progress)
+    if op.isfile(path):
+        try:
+            if not test:
+                os.remove(path)
+            if progress:
+                progress.update(path, files=1)
+            yield path
+        except OSError:
+            pass
+    elif op.isdir(path):
+        def scan(dirpath):
+            return _scandelete(dirpath, pfilter, recurse, test, progress)
+        if recurse and workers and workers > 1:
+            batches = _walkunordered(path, scan, workers)
+        else:
+            batches = _walkserial(path, scan)
+        for deleted in batches:
+            for i in deleted:
+                yield i
+    if progress:
+        progress.report(path)
+
+def _scandelete(dirpath, pfilter, recurse, test, progress):
+    """Deletes the matching files within a single directory for
+    ``iterdelete()``. Returns a list of the deleted paths and a list of
+    subdirectory paths to handle next."""
+    deleted = []
+    subdirs = []
+    dirfd = None
+    try:
+        if _DIRFD:
+            dirfd = os.open(dirpath, _DIRFLAGS)
+        entries = _scandir(dirpath if dirfd is None else dirfd)
+    except OSError:
+        if dirfd is not None:
+            os.close(dirfd)
+        return deleted, subdirs
+    try:
+        for entry in entries:
+            path = op.join(dirpath, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if recurse and not (pfilter and pfilter.excludes(entry.name)):
+                    subdirs.append(path)
+                continue
+            if not entry.is_file():
+                continue
+            if pfilter and not pfilter.match(path, entry.name):
+                continue
+            if not test:
+                try:
+                    if dirfd is None:
+                        os.remove(path)
                     else:
-                        yield File(op.join(startdir, i.name))
-                elif recurse:
-                    for j in walkfiles(op.join(startdir, i.name), regex, recurse, regex_entire):
-                        yield File(j)
-    else:
-        for r,_,fs in os.walk(startdir):
-            if not recurse and startdir != r:
-                return
-            for f in fs:
-                path = op.abspath(op.join(r,f))
-                n = path if regex_entire else f
-                if regex and not haspattern(regex, n):
+                        os.unlink(entry.name, dir_fd=dirfd)
+                except OSError:
                     continue
-                if op.isfile(path):
-                    yield File(path)
+            deleted.append(path)
+            if progress:
+                progress.update(path, files=1)
+    finally:
+        if dirfd is not None:
+            os.close(dirfd)
+    return deleted, subdirs
+
+def walkall(startdir, regex=None, regex_entire=True, recurse=False, workers=None, ordered=False):
+    """Yields a ``File`` or ``Dir`` for all found files and directories within
+    the given start directory. Can optionally filter paths using a regex
+    pattern (or a ``PathFilter``), either on the entire path if regex_entire is
+    true otherwise on the file name only. If `workers` is greater than one,
+    subdirectories are scanned concurrently by that many threads; results are
+    yielded as soon as they are available unless `ordered` is true, in which
+    case they are yielded in the same order as a sequential walk. Files and
+    directories are yielded together as each directory is listed rather than
+    all directories first. Symlinks to directories are yielded but not
+    recursed into."""
+    return _walk(startdir, regex, regex_entire, recurse, True, True, workers, ordered)
+
+def walkfiles(startdir, regex=None, regex_entire=True, recurse=False, workers=None, ordered=False):
+    """Yields a ``File`` for files found within the given start
+    directory. Can optionally filter paths using a regex pattern (or a
+    ``PathFilter``), either on the entire path if regex_entire is true
+    otherwise on the file name only. See ``walkall()`` for `workers` and
+    `ordered`."""
+    return _walk(startdir, regex, regex_entire, recurse, True, False, workers, ordered)
 
-def walkdirs(startdir, regex=None, regex_entire=True, recurse=False):
+def walkdirs(startdir, regex=None, regex_entire=True, recurse=False, workers=None, ordered=False):
     """Yields Path object for directories found within the given start
-    directory. Can optionally filter paths using a regex pattern, either on the
-    entire path if regex_entire is true otherwise on the directory name only."""
+    directory. Can optionally filter paths using a regex pattern (or a
+    ``PathFilter``), either on the entire path if regex_entire is true
+    otherwise on the directory name only. See ``walkall()`` for `workers` and
+    `ordered`."""
+    return _walk(startdir, regex, regex_entire, recurse, False, True, workers, ordered)
+
+def _walk(startdir, regex=None, regex_entire=True, recurse=False, files=True,
+        dirs=True, workers=None, ordered=False):
+    """Walks the given start directory iteratively using an explicit stack of
+    directories rather than nested generators. Each entry is listed once via
+    ``_scandir()`` and its cached type information is used to yield a ``File``
+    and/or ``Dir`` exactly once."""
     if not op.isdir(startdir):
         return
-    if sys.version_info >= (3, 6):
-        startdir = op.abspath(startdir)
-        with os.scandir(startdir) as it:
-            for i in it:
-                if i.is_dir():
-                    if regex:
-                        path = op.join(startdir, i.name)
-                        n = path if regex_entire else op.basename(i.name)
-                        if haspattern(regex, n):
-                            yield Dir(path)
-                    else:
-                        yield Dir(startdir, i.name)
-                    if recurse:
-                        for j in walkdirs(op.join(startdir, i.name), regex, recurse, regex_entire):
-                            yield Dir(j)
+    try:
+        pfilter = _tofilter(regex, regex_entire)
+    except re.error:
+        return
+    def scan(dirpath):
+        return _scanwalk(dirpath, pfilter, recurse, files, dirs)
+    startdir = op.abspath(startdir)
+    if recurse and workers and workers > 1:
+        if not ordered:
+            batches = _walkunordered(startdir, scan, workers)
+        elif ThreadPoolExecutor:
+            batches = _walkordered(startdir, scan, workers)
+        else:
+            batches = _walkserial(startdir, scan)
     else:
-        for r,ds,_ in os.walk(startdir):
-            if not recurse and startdir != r:
+        batches = _walkserial(startdir, scan)
+    for found in batches:
+        for entry, isdir in found:
+            yield Dir._fromentry(entry) if isdir else File._fromentry(entry)
+
+def _scanwalk(dirpath, pfilter, recurse, files, dirs):
+    """Lists a single directory for ``_walk()``. Returns a list of matching
+    `(entry, isdir)` tuples and a list of subdirectory paths to walk next."""
+    found = []
+    subdirs = []
+    try:
+        entries = _scandir(dirpath)
+    except OSError:
+        return found, subdirs
+    for entry in entries:
+        isdir = entry.is_dir()
+        if isdir:
+            # NOTE: Symlinked directories are not followed so that each entry
+            # is visited once and symlink loops cannot recurse forever.
+            if (recurse and entry.is_dir(follow_symlinks=False) and
+                    not (pfilter and pfilter.excludes(entry.name))):
+                subdirs.append(entry.path)
+            if not dirs:
+                continue
+        elif not files or not entry.is_file():
+            continue
+        if pfilter and not pfilter.match(entry.path, entry.name):
+            continue
+        found.append((entry, isdir))
+    return found, subdirs
+
+def _walkserial(startdir, scan):
+    """Yields the found entries of each directory scanned one at a time."""
+    stack = [startdir]
+    while stack:
+        found, subdirs = scan(stack.pop())
+        yield found
+        # NOTE: Pushed in reverse so that subdirectories are visited in
+        # listing order.
+        stack.extend(reversed(subdirs))
+
+def _walkordered(startdir, scan, workers):
+    """Same as ``_walkserial()`` but the directories at the top of the stack,
+    i.e. the ones that will be needed next, are scanned ahead of time by a
+    thread pool."""
+    prefetch = workers * 2
+    stack = [[startdir, None]]
+    pool = ThreadPoolExecutor(workers)
+    try:
+        while stack:
+            for item in stack[-prefetch:]:
+                if item[1] is None:
+                    item[1] = pool.submit(scan, item[0])
+            found, subdirs = stack.pop()[1].result()
+            yield found
+            stack.extend([d, None] for d in reversed(subdirs))
+    finally:
+        for item in stack:
+            if item[1] is not None:
+                item[1].cancel()
+        pool.shutdown(wait=True)
+
+def _walkunordered(startdir, scan, workers):
+    """Yields the found entries of each directory as soon as any of the worker
+    threads has scanned it. Found entries are passed through a bounded queue so
+    the workers cannot run arbitrarily far ahead of the consumer. An exception
+    raised by a scan stops the walk and is re-raised to the consumer."""
+    todo = queue.Queue()
+    out = queue.Queue(workers * 4)
+    stop = threading.Event()
+    lock = threading.Lock()
+    pending = [1]
+    def put(item):
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
                 return
-            for d in ds:
-                path = op.abspath(op.join(r,d))
-                n = path if regex_entire else d
-                if regex and not haspattern(regex, n):
-                    continue
-                if op.isfile(path):
-                    yield Dir(path)
+            except queue.Full:
+                pass
+    def work():
+        while not stop.is_set():
+            dirpath = todo.get()
+            if dirpath is None:
+                return
+            try:
+                found, subdirs = scan(dirpath)
+                with lock:
+                    pending[0] += len(subdirs)
+                for d in subdirs:
+                    todo.put(d)
+                if found:
+                    put(found)
+            except Exception:
+                put(sys.exc_info())
+                stop.set()
+            finally:
+                with lock:
+                    pending[0] -= 1
+                    done = 0 == pending[0]
+                if done:
+                    put(None)
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    todo.put(startdir)
+    try:
+        while True:
+            found = out.get()
+            if found is None:
+                break
+            if isinstance(found, tuple):
+                # NOTE: A worker failed; the exception carries its traceback.
+                raise found[1]
+            yield found
+    finally:
+        stop.set()
+        for t in threads:
+            todo.put(None)
+        for t in threads:
+            t.join()
+
+def _tofilter(regex, entire=True):
+    """Returns a ``PathFilter`` for the given regex pattern, which is returned
+    as-is if it is already a filter. Returns None if no regex is given."""
+    if not regex or isinstance(regex, PathFilter):
+        return regex or None
+    return PathFilter(regex, entire=entire)
+
+def _compileglobs(patterns):
+    """Splits the given glob patterns into a set of literal names and a list of
+    compiled regexes for the patterns containing wildcards."""
+    names = set()
+    regexes = []
+    for pattern in iterate(patterns or []):
+        pattern = op.normcase(pattern)
+        if _GLOBCHARS.search(pattern):
+            regexes.append(re.compile(fnmatch.translate(pattern)))
+        else:
+            names.add(pattern)
+    return frozenset(names), regexes
+
+def _matchglobs(name, names, regexes):
+    """Returns true if the given name matches one of the given literal names or
+    compiled glob regexes."""
+    if name in names:
+        return True
+    for regex in regexes:
+        if regex.match(name):
+            return True
+    return False
+
+def _mtimens(st):
+    """Returns the modification time of the given stat result in
+    nanoseconds."""
+    mtime = getattr(st, "st_mtime_ns", None)
+    return mtime if mtime is not None else int(st.st_mtime * 1e9)
+
+def _snaprecord(st):
+    """Returns the ``Snapshot`` record for the given (non-following) stat
+    result: `[isdir, size, mtime_ns, inode]`."""
+    isdir = 1 if stat.S_ISDIR(st.st_mode) else 0
+    return [isdir, 0 if isdir else st.st_size, _mtimens(st), st.st_ino]
+
+def _scandir(path):
+    """Returns a list of ``os.DirEntry`` objects for the given directory. The
+    underlying directory handle is closed before returning. Falls back to
+    ``_DirEntry`` objects if ``os.scandir()`` is not available."""
+    if not hasattr(os, "scandir"):
+        return [_DirEntry(path, name) for name in os.listdir(path)]
+    it = os.scandir(path)
+    try:
+        return list(it)
+    finally:
+        if hasattr(it, "close"):
+            it.close()
+
+def treestats(path, recurse=False, workers=None):
+    """Returns a ``TreeStats`` for the given directory path gathered in a single
+    pass over the directory entries. Symlinked directories are counted but not
+    recursed into. If `workers` is greater than one, subdirectories are scanned
+    concurrently. A file path returns the stats for that file only.
+
+    **Examples**:
+    ::
+        stats = auxly.filesys.treestats("foo", recurse=True)
+        stats.files, stats.dirs, stats.size
+    """
+    totals = [0] * len(TreeStats._fields)
+    if op.isdir(path):
+        def scan(dirpath):
+            return _scanstats(dirpath, recurse)
+        startdir = op.abspath(path)
+        if recurse and workers and workers > 1:
+            batches = _walkunordered(startdir, scan, workers)
+        else:
+            batches = _walkserial(startdir, scan)
+        for found in batches:
+            for i, count in enumerate(found):
+                totals[i] += count
+    elif op.isfile(path):
+        try:
+            totals[0] = 1
+            totals[2] = op.getsize(path)
+            totals[3] = int(op.islink(path))
+        except OSError:
+            totals[4] = 1
+    return TreeStats(*totals)
+
+def _scanstats(dirpath, recurse):
+    """Lists a single directory for ``treestats()``. Returns a list of counts in
+    ``TreeStats`` order and a list of subdirectory paths to scan next."""
+    files = dirs = size = symlinks = errors = 0
+    subdirs = []
+    try:
+        entries = _scandir(dirpath)
+    except OSError:
+        return [0, 0, 0, 0, 1], subdirs
+    for entry in entries:
+        islink = entry.is_symlink()
+        if islink:
+            symlinks += 1
+        if entry.is_dir():
+            dirs += 1
+            if recurse and not islink:
+                subdirs.append(entry.path)
+            continue
+        files += 1
+        try:
+            size += entry.stat().st_size
+        except OSError:
+            errors += 1
+    return [files, dirs, size, symlinks, errors], subdirs
 
 def countall(path, recurse=False):
     """Returns the number of directories and files under the given directory
     path."""
-    return countfiles(path, recurse) + countdirs(path, recurse)
+    if not op.isdir(path):
+        return 0
+    stats = treestats(path, recurse)
+    return stats.files + stats.dirs
 
 def countfiles(path, recurse=False):
     """Returns the number of files under the given directory path."""
     if not op.isdir(path):
         return 0
-    count = 0
-    for r,ds,fs in os.walk(path):
-        count += len(fs)
-        if not recurse:
-            break
-    return count
+    return treestats(path, recurse).files
 
 def countdirs(path, recurse=False):
     """Returns the number of directories under the given directory path."""
     if not op.isdir(path):
         return 0
-    count = 0
-    for r,ds,fs in os.walk(path):
-        count += len(ds)
-        if not recurse:
-            break
-    return count
+    return treestats(path, recurse).dirs
 
 def isempty(path):
     """Returns true if the given file or directory path is empty.
@@ -478,17 +1854,15 @@ def getsize(path, recurse=False):
     """Returns the size of the file or directory in bytes."""
     if not op.isdir(path):
         return op.getsize(path)
-    size = 0
-    for r,_,fs in os.walk(path):
-        for f in fs:
-            size += getsize(op.join(r,f))
-        if not recurse:
-            break
-    return size
-
-def copy(srcpath, dstpath, overwrite=True):
+    return treestats(path, recurse).size
+
+def copy(srcpath, dstpath, overwrite=True, workers=None, progress=None):
     """Copies the file or directory at `srcpath` to `dstpath`. Returns true if
-    successful, otherwise false."""
+    successful, otherwise false. When copying a directory, the destination
+    directories are created up front and the files are then copied by the
+    given number of worker threads. File data is cloned or copied by the kernel
+    where the platform supports it. Progress is reported to the optional
+    `progress` callback or ``Progress``."""
     # Handle bail conditions.
     if not op.exists(srcpath):
         return False
@@ -511,13 +1885,21 @@ def copy(srcpath, dstpath, overwrite=True):
             # Make sure srcdir is copied INTO dstdir.
             dstdir = op.join(dstpath, op.basename(srcpath))
         makedirs(dstdir)
+        todo = []
         for r,ds,fs in os.walk(srcpath):
             basedir = r.replace(srcpath, "").rstrip(os.sep).strip(os.sep)
             curdir = op.join(dstdir, basedir)
-            makedirs(curdir)
+            makedirs(curdir, ignore_extsep=True)
             for f in fs:
-                if not copy(op.join(r,f), op.join(curdir, f), overwrite=overwrite):
+                dstfile = op.join(curdir, f)
+                if not overwrite and op.exists(dstfile):
                     return False
+                todo.append((op.join(r,f), dstfile))
+        progress = _toprogress(progress)
+        for _ in _imap(lambda paths: _copyfile(paths[0], paths[1], progress), todo, workers):
+            pass
+        if progress:
+            progress.report(srcpath)
     elif op.isfile(srcpath):
         dstdir = dstpath
         if op.basename(srcpath).count(".") == 0 and op.basename(srcpath) == op.basename(dstpath):
@@ -529,13 +1911,193 @@ def copy(srcpath, dstpath, overwrite=True):
             # to that directory.
             dstdir = op.dirname(dstpath)
         makedirs(dstdir)
-        shutil.copy2(srcpath, dstpath)
+        progress = _toprogress(progress)
+        if op.isdir(dstpath):
+            _copyfile(srcpath, op.join(dstpath, op.basename(srcpath)), progress)
+        else:
+            _copyfile(srcpath, dstpath, progress)
+        if progress:
+            progress.report(srcpath)
 
     return op.exists(dstpath)
 
-def move(srcpath, dstpath, overwrite=True):
+def sync(srcdir, dstdir, purge=False, verify=False, test=False):
+    """Makes the contents of the destination directory match the contents of
+    the source directory. Only files that are missing or differ in size or
+    modification time are copied; if `verify` is true, files that look
+    unchanged are also compared by checksum. If `purge` is true, destination
+    entries that are not in the source are deleted. Returns a ``SyncResult``
+    of the affected destination paths. If `test` is true, nothing is changed
+    and the paths that would have been affected are returned.
+
+    **Examples**:
+    ::
+        auxly.filesys.sync("foo", "backup/foo", purge=True)
+    """
+    copied = []
+    deleted = []
+    failed = []
+    if not op.isdir(srcdir) or op.isfile(dstdir):
+        return SyncResult(copied, deleted, failed)
+    srcdir = op.abspath(srcdir)
+    dstdir = op.abspath(dstdir)
+    def remove(path, isdir):
+        if not test:
+            try:
+                if isdir:
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            except Exception:
+                failed.append(path)
+                return False
+        deleted.append(path)
+        return True
+    stack = [(srcdir, dstdir)]
+    while stack:
+        src, dst = stack.pop()
+        try:
+            srcentries = _scandir(src)
+        except OSError:
+            failed.append(dst)
+            continue
+        try:
+            dstentries = dict((e.name, e) for e in _scandir(dst))
+        except OSError:
+            dstentries = {}
+            if not test:
+                try:
+                    os.makedirs(dst)
+                except OSError:
+                    failed.append(dst)
+                    continue
+        for entry in srcentries:
+            dstentry = dstentries.pop(entry.name, None)
+            dstpath = op.join(dst, entry.name)
+            if entry.is_dir():
+                if entry.is_symlink():
+                    continue
+                if dstentry is not None and not dstentry.is_dir():
+                    if not remove(dstpath, False):
+                        continue
+                stack.append((entry.path, dstpath))
+                continue
+            if dstentry is not None:
+                if dstentry.is_dir():
+                    if not remove(dstpath, True):
+                        continue
+                elif not _changed(entry, dstentry, verify):
+                    continue
+            if not test:
+                try:
+                    _copyfile(entry.path, dstpath)
+                except Exception:
+                    failed.append(dstpath)
+                    continue
+            copied.append(dstpath)
+        if purge:
+            for name, dstentry in dstentries.items():
+                remove(dstentry.path, dstentry.is_dir() and not dstentry.is_symlink())
+    return SyncResult(copied, deleted, failed)
+
+def _changed(srcentry, dstentry, verify=False):
+    """Returns true if the given source and destination directory entries for
+    a file differ."""
+    try:
+        srcstat = srcentry.stat()
+        dststat = dstentry.stat()
+    except OSError:
+        return True
+    if srcstat.st_size != dststat.st_size:
+        return True
+    if int(srcstat.st_mtime) != int(dststat.st_mtime):
+        return True
+    if verify:
+        return checksum(srcentry.path, asbytes=True) != checksum(dstentry.path, asbytes=True)
+    return False
+
+def _copyfile(srcpath, dstpath, progress=None):
+    """Copies the file contents and metadata like ``shutil.copy2()`` but lets
+    the kernel do the work where possible. The file is cloned if the file
+    system supports it, otherwise ``os.copy_file_range()`` or ``os.sendfile()``
+    is used, falling back to a regular buffered copy. Raises an error like
+    ``shutil.copy2()`` if both paths are the same file."""
+    if op.exists(dstpath) and _samefile(srcpath, dstpath):
+        raise _SameFileError("%r and %r are the same file" % (srcpath, dstpath))
+    done = [0]
+    def update(nbytes):
+        done[0] += nbytes
+        if progress:
+            progress.update(srcpath, nbytes)
+    with io.open(srcpath, "rb") as fi:
+        with io.open(dstpath, "wb") as fo:
+            infd = fi.fileno()
+            outfd = fo.fileno()
+            if not _kernelcopy(infd, outfd, update):
+                # NOTE: Bytes copied by a failed kernel copy are copied again
+                # so they are taken back out of the progress first.
+                update(-done[0])
+                os.lseek(infd, 0, os.SEEK_SET)
+                os.lseek(outfd, 0, os.SEEK_SET)
+                os.ftruncate(outfd, 0)
+                while True:
+                    block = fi.read(BLOCKSIZE)
+                    if not block:
+                        break
+                    fo.write(block)
+                    update(len(block))
+    shutil.copystat(srcpath, dstpath)
+    if progress:
+        progress.update(srcpath, files=1)
+
+def _samefile(path1, path2):
+    """Returns true if both paths refer to the same file."""
+    if hasattr(op, "samefile"):
+        try:
+            return op.samefile(path1, path2)
+        except OSError:
+            return False
+    return op.normcase(op.abspath(path1)) == op.normcase(op.abspath(path2))
+
+def _kernelcopy(infd, outfd, update):
+    """Copies all data between the given file descriptors without passing it
+    through Python buffers, calling the given function with the number of bytes
+    copied after each chunk. Returns true if successful, otherwise false in
+    which case the descriptors may have been partially written/read."""
+    if fcntl and auxly.islinux():
+        try:
+            fcntl.ioctl(outfd, _FICLONE, infd)
+            update(os.fstat(infd).st_size)
+            return True
+        except (IOError, OSError):
+            pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            while True:
+                sent = os.copy_file_range(infd, outfd, BLOCKSIZE * 8)
+                if not sent:
+                    return True
+                update(sent)
+        except OSError:
+            return False
+    if hasattr(os, "sendfile") and not auxly.iswindows():
+        try:
+            offset = 0
+            while True:
+                sent = os.sendfile(outfd, infd, offset, BLOCKSIZE * 8)
+                if not sent:
+                    return True
+                offset += sent
+                update(sent)
+        except OSError:
+            return False
+    return False
+
+def move(srcpath, dstpath, overwrite=True, progress=None):
     """Moves the file or directory at `srcpath` to `dstpath`. Returns true if
-    successful, otherwise false."""
+    successful, otherwise false. Progress is reported to the optional
+    `progress` callback or ``Progress``; bytes are only counted if the data has
+    to be copied, e.g. between file systems."""
     # TODO: Consider adding smarter checks to prevent files ending up with
     # directory names; e.g. if dstpath directory does not exist.
     srcpath = op.abspath(srcpath)
@@ -569,35 +2131,469 @@ def move(srcpath, dstpath, overwrite=True):
                 pass
             elif not delete(verpath):
                 return False
+    progress = _toprogress(progress)
     try:
-        shutil.move(srcpath, dstpath)
+        if progress and sys.version_info >= (3, 5):
+            copied = [0]
+            def copyfunc(src, dst):
+                if op.isdir(dst):
+                    dst = op.join(dst, op.basename(src))
+                _copyfile(src, dst, progress)
+                copied[0] += 1
+            shutil.move(srcpath, dstpath, copy_function=copyfunc)
+            if not copied[0]:
+                progress.update(srcpath, files=1)
+        else:
+            shutil.move(srcpath, dstpath)
+            if progress:
+                progress.update(srcpath, files=1)
     except Exception as ex:
         return auxly.AuxlyError(ex)
+    if progress:
+        progress.report(srcpath)
     return verfunc(verpath)
 
-def checksum(fpath, hasher=None, asbytes=False):
+def checksum(fpath, hasher=None, asbytes=False, blocksize=BLOCKSIZE, cache=None, progress=None, mapped=False):
     """Returns the checksum of the file at the given path as a hex string
-    (default) or as a bytes literal. Uses MD5 by default.
+    (default) or as a bytes literal. Uses MD5 by default; `hasher` may be a
+    hashlib object, a hashlib algorithm name or a hashlib constructor. The file
+    is read in blocks of `blocksize` bytes into a reused buffer, or hashed
+    directly from a memory map if `mapped` is true. If a ``ChecksumCache`` is
+    given, the file is only read if it changed since its checksum was cached.
+    Progress is reported to the optional `progress` callback or ``Progress``.
 
     **Attribution**:
     Based on code from
     `Stack Overflow <https://stackoverflow.com/a/3431835/789078>`_."""
-    def blockiter(fpath, blocksize=0x1000):
-        with open(fpath, "rb") as afile:
-            block = afile.read(blocksize)
-            while len(block) > 0:
-                yield block
-                block = afile.read(blocksize)
+    progress = _toprogress(progress)
+    result = _checksum(fpath, hasher, asbytes, blocksize, cache, progress, mapped)
+    if progress:
+        progress.report(fpath)
+    return result
+
+def _checksum(fpath, hasher, asbytes, blocksize, cache, progress, mapped=False):
+    """Handles ``checksum()`` without the final progress report."""
     if not op.exists(fpath):
         return None
     try:
-        hasher = hasher or hashlib.md5()
-        for block in blockiter(fpath):
-            hasher.update(block)
-        return (hasher.digest() if asbytes else hasher.hexdigest())
+        hasher = _tohasher(hasher)
+        if cache is None:
+            _hashfile(fpath, hasher, blocksize, progress, mapped)
+            digest = hasher.digest()
+        else:
+            st = os.stat(fpath)
+            digest = cache.get(fpath, hasher.name.lower(), st)
+            if digest is None:
+                _hashfile(fpath, hasher, blocksize, progress, mapped)
+                digest = hasher.digest()
+                cache.put(fpath, hasher.name.lower(), digest, st)
+        if progress:
+            progress.update(fpath, files=1)
+        return (digest if asbytes else binascii.hexlify(digest).decode("ascii"))
     except Exception as ex:
         return auxly.AuxlyError(ex)
 
+def checksums(fpaths, hasher=None, asbytes=False, blocksize=BLOCKSIZE, workers=4, cache=None, progress=None, mapped=False):
+    """Yields a `(path, checksum)` tuple for each of the given file paths as
+    soon as its checksum is available. The files are hashed concurrently by the
+    given number of worker threads; results are therefore not necessarily in
+    the same order as the paths. Otherwise the same as ``checksum()``; a
+    hashlib object given as `hasher` is copied for each file.
+
+    **Examples**:
+    ::
+        for path, digest in auxly.filesys.checksums(auxly.filesys.walkfiles("foo")):
+            print(path, digest)
+    """
+    progress = _toprogress(progress)
+    def work(fpath):
+        h = hasher.copy() if hasattr(hasher, "copy") else hasher
+        return fpath, _checksum(fpath, h, asbytes, blocksize, cache, progress, mapped)
+    for result in _imap(work, fpaths, workers):
+        yield result
+    if progress:
+        progress.report()
+
+def duplicates(startdir, regex=None, regex_entire=True, recurse=True, minsize=1,
+        hasher=None, blocksize=BLOCKSIZE, workers=None, cache=None):
+    """Yields lists of ``File`` objects for files found within the given start
+    directory that have identical contents. Candidates are narrowed down in
+    stages: first by size, then by a checksum of their first and last blocks
+    and only then by a full checksum, so most files are never read entirely.
+    Groups are yielded as soon as they are confirmed. Files smaller than
+    `minsize` bytes are ignored and hard links to the same file are only
+    included once. The remaining options are the same as for ``walkfiles()``
+    and ``checksums()``.
+
+    **Examples**:
+    ::
+        for group in auxly.filesys.duplicates("foo"):
+            print(group)
+    """
+    def fresh():
+        return hasher.copy() if hasattr(hasher, "copy") else _tohasher(hasher)
+    bysize = {}
+    seen = set()
+    for f in walkfiles(startdir, regex, regex_entire, recurse, workers):
+        st = f.stat()
+        if not st or st.st_size < minsize:
+            continue
+        if st.st_ino:
+            if (st.st_dev, st.st_ino) in seen:
+                continue
+            seen.add((st.st_dev, st.st_ino))
+        bysize.setdefault(st.st_size, []).append(f)
+    candidates = [(size, f) for size, group in bysize.items() if len(group) > 1 for f in group]
+    del bysize, seen
+
+    def edgework(item):
+        size, f = item
+        try:
+            return size, f, _edgehash(f, fresh(), size)
+        except Exception:
+            return size, f, None
+    byedge = {}
+    for size, f, digest in _imap(edgework, candidates, workers):
+        if digest is not None:
+            byedge.setdefault((size, digest), []).append(f)
+    fulls = []
+    pending = {}
+    for key, group in byedge.items():
+        if len(group) < 2:
+            continue
+        if key[0] <= 2 * _EDGESIZE:
+            # NOTE: The first and last blocks cover the whole file.
+            yield sorted(group)
+            continue
+        pending[key] = [len(group), {}]
+        fulls.extend((key, f) for f in group)
+    del byedge
+
+    def fullwork(item):
+        key, f = item
+        return key, f, checksum(f, fresh(), True, blocksize, cache)
+    for key, f, digest in _imap(fullwork, fulls, workers):
+        state = pending[key]
+        state[0] -= 1
+        if isinstance(digest, bytes):
+            state[1].setdefault(digest, []).append(f)
+        if not state[0]:
+            del pending[key]
+            for group in state[1].values():
+                if len(group) > 1:
+                    yield sorted(group)
+
+def grep(startdir, pattern, regex=None, regex_entire=True, recurse=True,
+        filesonly=False, flags=0, encoding=None, workers=None):
+    """Yields (``File``, line number, line) for each line matching the given
+    regex pattern in the files found within the given start directory. Files
+    are memory-mapped and searched as bytes, so only matching lines are
+    decoded. Files with a null byte in their first block are treated as
+    binary and skipped; files that cannot be read are skipped as well. If
+    `filesonly` is true, only the ``File`` of each file with a match is
+    yielded and the search of a file stops at its first match. With
+    multiple `workers`, files are searched in parallel and yielded in
+    completion order; lines of a file are always yielded in order. The
+    `regex`, `regex_entire` and `recurse` options are the same as for
+    ``walkfiles()``.
+
+    **Examples**:
+    ::
+        for f, num, line in auxly.filesys.grep("src", r"TODO", regex=r"\.py$"):
+            print(f, num, line)
+    """
+    encoding = encoding or ENCODING
+    if hasattr(pattern, "pattern"):
+        flags |= pattern.flags
+        pattern = pattern.pattern
+    if not isinstance(pattern, bytes):
+        pattern = pattern.encode(encoding)
+    pattern = re.compile(pattern, (flags | re.MULTILINE) & ~re.UNICODE)
+    def work(f):
+        try:
+            return _grepfile(f, pattern, filesonly, encoding)
+        except Exception:
+            return []
+    files = walkfiles(startdir, regex, regex_entire, recurse)
+    for found in _imap(work, files, workers):
+        for item in found:
+            yield item
+
+def _grepfile(f, pattern, filesonly, encoding):
+    """Returns the ``grep()`` results for a single file."""
+    with _FileMap(f, strict=True) as data:
+        if not data or b"\0" in data[:_EDGESIZE]:
+            return []
+        found = []
+        lineno = 1
+        counted = 0
+        for start, end in _greplines(data, pattern):
+            if filesonly:
+                return [f]
+            lineno += _countlines(data, counted, start)
+            counted = start
+            found.append((f, lineno, _decodeline(data[start:end], encoding)))
+        return found
+
+def _greplines(data, pattern):
+    """Yields the (start, end) offsets of the lines of the given data that
+    match the given multiline pattern. The whole data is searched at once;
+    a match that runs across a line break is checked again within its first
+    line only."""
+    pos = 0
+    size = len(data)
+    while pos < size:
+        match = pattern.search(data, pos)
+        if not match:
+            return
+        start = data.rfind(b"\n", 0, match.start()) + 1
+        if start >= size:
+            # NOTE: An empty match after the trailing line break is not a line.
+            return
+        end = data.find(b"\n", match.start())
+        if end < 0:
+            end = size
+        if match.end() <= end or pattern.search(data, start, end):
+            yield start, end
+        pos = end + 1
+
+def _countlines(data, start, end):
+    """Returns the number of line breaks in the given range of the data,
+    counting one bounded block at a time so that large ranges of memory-mapped
+    data are never copied at once."""
+    count = 0
+    for pos in range(start, end, BLOCKSIZE):
+        count += data[pos:min(pos + BLOCKSIZE, end)].count(b"\n")
+    return count
+
+def watch(path, debounce=0.1, interval=1.0, checkfiles=False, timeout=None):
+    """Yields a ``WatchEvent`` for each change within the given directory tree
+    until the generator is closed. On Linux, inotify watches are used so
+    waiting costs nothing; elsewhere (or if the watches cannot be set up) a
+    ``Snapshot`` is rescanned every `interval` seconds, listing only the
+    directories whose modification time changed and, if `checkfiles` is
+    true, checking the files of the others for in-place modifications.
+    Events are collected for `debounce` seconds after the first one arrives
+    and coalesced per path before being yielded, e.g. a file created and
+    then written yields a single `created` event and a file created and
+    deleted again yields nothing. An `overflow` event means changes were
+    lost and the tree should be rescanned. The generator stops after the
+    watched directory itself is deleted. If `timeout` is given, it also stops
+    once no event has arrived for that many seconds. If an error occurs, an
+    AuxlyError is yielded as the final item.
+
+    **Examples**:
+    ::
+        for event in auxly.filesys.watch("foo", debounce=0.5):
+            print(event.kind, event.path)
+    """
+    path = op.abspath(path)
+    watcher = None
+    try:
+        if _Inotify.available():
+            try:
+                watcher = _InotifyWatcher(path)
+            except Exception:
+                watcher = None
+        if watcher is None:
+            watcher = _PollWatcher(path, interval, checkfiles)
+        pending = {}
+        order = []
+        deadline = None
+        last = _clock()
+        while True:
+            now = _clock()
+            if deadline is not None and (now >= deadline or watcher.done):
+                for p in order:
+                    kind = pending.pop(p, None)
+                    if kind:
+                        yield WatchEvent(kind, p)
+                order = []
+                deadline = None
+                last = _clock()
+                continue
+            if watcher.done:
+                return
+            if deadline is not None:
+                wait = deadline - now
+            elif timeout is not None:
+                wait = timeout - (now - last)
+                if wait <= 0:
+                    return
+            else:
+                wait = None
+            for kind, p in watcher.poll(wait):
+                _coalesce(pending, order, kind, p)
+                if deadline is None:
+                    deadline = _clock() + debounce
+    except Exception as ex:
+        yield auxly.AuxlyError(ex)
+    finally:
+        if watcher:
+            watcher.close()
+
+def _coalesce(pending, order, kind, path):
+    """Merges a change of the given kind into the pending ``watch()``
+    changes."""
+    old = pending.get(path)
+    if old is None:
+        pending[path] = kind
+        order.append(path)
+    elif "created" == old:
+        if "deleted" == kind:
+            del pending[path]
+    elif "deleted" == old:
+        if "created" == kind:
+            pending[path] = "modified"
+    elif "deleted" == kind:
+        pending[path] = kind
+
+def _edgehash(fpath, hasher, size):
+    """Returns the digest of the first and last blocks of the given file of the
+    given size."""
+    with io.open(fpath, "rb") as fi:
+        hasher.update(fi.read(_EDGESIZE))
+        if size > _EDGESIZE:
+            fi.seek(max(_EDGESIZE, size - _EDGESIZE))
+            hasher.update(fi.read(_EDGESIZE))
+    return hasher.digest()
+
+def _samecontent(fpath, data, blocksize=BLOCKSIZE):
+    """Returns true if the given file holds exactly the given bytes. Sizes are
+    compared first; the content is then compared block by block, stopping at
+    the first difference."""
+    try:
+        st = os.stat(fpath)
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode) or st.st_size != len(data):
+        return False
+    view = memoryview(data)
+    with io.open(fpath, "rb") as fi:
+        for pos in range(0, len(data), blocksize):
+            if fi.read(blocksize) != view[pos:pos + blocksize]:
+                return False
+    return True
+
+def _tailsplit(fi, size, lines):
+    """Reads the given binary file handle backwards from the given size.
+    Returns a list of the last complete lines (as bytes, without line endings)
+    and the trailing bytes after the last line break."""
+    chunks = []
+    count = 0
+    pos = size
+    # NOTE: One extra line break is needed to know the first line is complete.
+    while pos > 0 and count <= lines:
+        step = min(_TAILSIZE, pos)
+        pos -= step
+        fi.seek(pos)
+        chunk = fi.read(step)
+        chunks.append(chunk)
+        count += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    index = data.rfind(b"\n") + 1
+    found = data[:index].split(b"\n")[:-1]
+    return (found[-lines:] if lines > 0 else []), data[index:]
+
+def _decodeline(line, encoding):
+    """Decodes a raw line read by ``File.tail()`` or ``File.follow()``."""
+    return line.decode(encoding, "replace").rstrip("\r")
+
+def _openfollow(fpath):
+    """Returns a binary handle for the given file or None if it does not
+    exist."""
+    try:
+        return io.open(fpath, "rb")
+    except (IOError, OSError):
+        return None
+
+def _rotated(fpath, st):
+    """Returns true if the given path no longer refers to the file with the
+    given stat result."""
+    try:
+        cur = os.stat(fpath)
+    except OSError:
+        return True
+    return (cur.st_ino, cur.st_dev) != (st.st_ino, st.st_dev)
+
+def _closeref(ref):
+    """Closes the object of the given weak reference if it is still alive."""
+    obj = ref()
+    if obj is not None:
+        obj.close()
+
+def _toprogress(progress):
+    """Returns a ``Progress`` for the given progress option or None."""
+    if progress is None or isinstance(progress, Progress):
+        return progress
+    return Progress(progress)
+
+def _tohasher(hasher):
+    """Returns a hashlib object for the given ``checksum()`` hasher option."""
+    if hasher is None:
+        return hashlib.md5()
+    if isinstance(hasher, str):
+        return hashlib.new(hasher)
+    if not hasattr(hasher, "update"):
+        return hasher()
+    return hasher
+
+def _hashfile(fpath, hasher, blocksize, progress=None, mapped=False):
+    """Updates the given hasher with the contents of the file at the given
+    path. Reads directly into a buffer that is reused by the calling thread or,
+    if `mapped` is true, hashes slices of a memory map of the file."""
+    if mapped and hasattr(memoryview, "release"):
+        with _FileMap(fpath, strict=True) as data:
+            view = memoryview(data)
+            try:
+                for offset in range(0, len(view), blocksize):
+                    hasher.update(view[offset:offset + blocksize])
+                    if progress:
+                        progress.update(fpath, min(blocksize, len(view) - offset))
+            finally:
+                view.release()
+        return
+    buf = getattr(_buffers, "buf", None)
+    if buf is None or len(buf) != blocksize:
+        buf = _buffers.buf = bytearray(blocksize)
+    view = memoryview(buf)
+    with io.open(fpath, "rb", buffering=0) as fi:
+        while True:
+            count = fi.readinto(buf)
+            if not count:
+                break
+            hasher.update(view[:count])
+            if progress:
+                progress.update(fpath, count)
+
+def _imap(func, items, workers):
+    """Yields the result of calling the given function on each item, using a
+    pool of worker threads if more than one worker is requested. Results are
+    yielded in completion order and at most a few items per worker are in
+    flight at a time, so the items may be a lazy iterable."""
+    if not workers or workers < 2 or not ThreadPoolExecutor:
+        for item in items:
+            yield func(item)
+        return
+    pending = set()
+    items = iter(items)
+    pool = ThreadPoolExecutor(workers)
+    try:
+        for item in items:
+            pending.add(pool.submit(func, item))
+            if len(pending) >= workers * 2:
+                done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
 def rootdir():
     """Returns the system root directory."""
     return os.path.abspath(os.sep)
@@ -2,6 +2,7 @@
 ## SECTION: Imports                                             #
 ##==============================================================#
 
+from collections import namedtuple
 import atexit
 import functools
 import os
@@ -10,9 +11,40 @@ import subprocess
 import sys
 import signal
 import tempfile
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+try:
+    import selectors
+except ImportError:
+    selectors = None
+try:
+    from concurrent import futures
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
 
 import top as auxly
 
+if sys.version_info >= (3, 6):
+    from _ashell import (
+            AsyncProcess,
+            acall,
+            aitererr,
+            aiterout,
+            aiterstd,
+            alisterr,
+            alistout,
+            asilent,
+            astart,
+            astrerr,
+            astrout,
+        )
+
 ##==============================================================#
 ## SECTION: Global Definitions                                  #
 ##==============================================================#
@@ -20,10 +52,27 @@ import top as auxly
 #: Null device.
 NULL = open(os.devnull, "w")
 
+#: Index of the executables on PATH used by ``which()``; holds the PATH value
+#: and directory modification times it was built from, the index of names to
+#: directories, and the memoized lookups.
+_pathindex = (None, {}, {})
+
+#: Monotonic clock used for command durations.
+_clock = getattr(time, "monotonic", time.time)
+
+#: Size in bytes of the blocks read from command output pipes.
+_PIPESIZE = 0x10000
+
 ##==============================================================#
 ## SECTION: Class Definitions                                   #
 ##==============================================================#
 
+#: Result of a command run by ``run()``; includes the command, its exit code,
+#: decoded stdout and stderr, the wall time in seconds, the user and system
+#: CPU time in seconds and the peak resident set size in bytes. The resource
+#: usage fields are None where ``os.wait4()`` is not available.
+RunResult = namedtuple("RunResult", "cmd exitcode stdout stderr duration utime stime maxrss")
+
 class Process(object):
     """Runs the given command in a separate shell process."""
     def __init__(self, cmd, logpath=None):
@@ -122,48 +171,317 @@ def start(cmd, logpath=None, **kwargs):
     """
     return Process(cmd, logpath)
 
-def has(cmd):
-    """Returns true if the give shell command is available.
+def which(cmd):
+    """Returns the path of the executable for the given command name found on
+    PATH, or None if there is none. No process is spawned; PATH is scanned
+    once into an index that is only rebuilt when PATH or one of its
+    directories changes, and lookups are memoized.
+
+    **Examples**:
+    ::
+        auxly.shell.which("ls")  # "/bin/ls"
+    """
+    if op.dirname(cmd):
+        return op.abspath(cmd) if _isexe(cmd) else None
+    _, index, memo = _getpathindex()
+    key = op.normcase(cmd)
+    if key in memo:
+        return memo[key]
+    found = None
+    exts = [""]
+    if auxly.iswindows():
+        exts += [e for e in os.environ.get("PATHEXT", "").split(os.pathsep) if e]
+    for ext in exts:
+        for d in index.get(op.normcase(cmd + ext), []):
+            if _isexe(op.join(d, cmd + ext)):
+                found = op.join(d, cmd + ext)
+                break
+        if found:
+            break
+    memo[key] = found
+    return found
+
+def _getpathindex():
+    """Returns the current PATH index, rebuilding it if PATH or the
+    modification time of one of its directories changed."""
+    global _pathindex
+    path = os.environ.get("PATH", "")
+    dirs = [d for d in path.split(os.pathsep) if d]
+    mtimes = []
+    for d in dirs:
+        try:
+            mtimes.append(os.stat(d).st_mtime)
+        except OSError:
+            mtimes.append(None)
+    key = (path, tuple(mtimes))
+    current = _pathindex
+    if current[0] == key:
+        return current
+    index = {}
+    for d in dirs:
+        try:
+            names = os.listdir(d)
+        except OSError:
+            continue
+        for name in names:
+            index.setdefault(op.normcase(name), []).append(d)
+    current = (key, index, {})
+    _pathindex = current
+    return current
+
+def _isexe(path):
+    """Returns true if the given path is an executable file."""
+    return op.isfile(path) and os.access(path, os.X_OK)
+
+def has(cmd, probe=True):
+    """Returns true if the give shell command is available. Commands found on
+    PATH by ``which()`` are reported without spawning a process; otherwise,
+    if `probe` is true, the command is run with common help options to
+    detect shell builtins and the like.
 
     **Examples**:
     ::
         auxly.shell.has("ls")  # True
     """
+    if which(cmd):
+        return True
+    if not probe:
+        return False
     helps = ["--help", "-h", "--version"]
     if "nt" == os.name:
         helps.insert(0, "/?")
     fakecmd = "fakecmd"
-    cmderr = strerr(fakecmd).replace(fakecmd, cmd)
+    cmderr = run(fakecmd).stderr.replace(fakecmd, cmd)
     for h in helps:
-        hcmd = "%s %s" % (cmd, h)
-        if 0 == silent(hcmd):
+        result = run("%s %s" % (cmd, h))
+        if 0 == result.exitcode:
             return True
-        if len(listout(hcmd)) > 0:
+        if result.stdout:
             return True
-        if strerr(hcmd) != cmderr:
+        if result.stderr != cmderr:
             return True
     return False
 
-def iterstd(cmd, std="out", **kwargs):
-    """Iterates through the lines of a stderr/stdout stream for the given shell
-    command."""
-    def _readline():
+def hasall(cmds):
+    """Returns true if all the given commands are found on PATH by
+    ``which()``. No process is spawned.
+
+    **Examples**:
+    ::
+        auxly.shell.hasall(["git", "make"])
+    """
+    return all(which(cmd) for cmd in cmds)
+
+def runmany(cmds, workers=4, ordered=False, stoponfail=False, **kwargs):
+    """Runs the given shell commands concurrently, at most `workers` at a time,
+    and yields the ``run()`` result for each. Results are yielded in completion
+    order, or in the order of the commands if `ordered` is true. If
+    `stoponfail` is true, no further commands are started once a result
+    with a non-zero exit code has been yielded; commands already running
+    are waited for but their results are discarded. The commands may be a
+    lazy iterable. If `concurrent.futures` is not available (e.g. Python 2.7
+    without the `futures` backport), the commands are run one at a time.
+
+    **Examples**:
+    ::
+        for result in auxly.shell.runmany(["make a", "make b"], workers=8):
+            print(result.cmd, result.exitcode, result.duration)
+    """
+    if not workers or workers < 2 or not ThreadPoolExecutor:
+        for cmd in cmds:
+            result = run(cmd, **kwargs)
+            yield result
+            if stoponfail and result.exitcode:
+                return
+        return
+    cmds = iter(cmds)
+    exhausted = False
+    pending = []
+    pool = ThreadPoolExecutor(workers)
+    try:
         while True:
-            line = getattr(proc, "std"+std).readline()
-            if line != b"":
-                yield line.rstrip().decode("UTF-8", "replace")
+            while not exhausted and len(pending) < workers * 2:
+                try:
+                    cmd = next(cmds)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append(pool.submit(run, cmd, **kwargs))
+            if not pending:
+                return
+            if ordered:
+                done = [pending.pop(0)]
             else:
-                break
+                done = futures.wait(pending, return_when=futures.FIRST_COMPLETED)[0]
+                pending = [future for future in pending if future not in done]
+            for future in done:
+                result = future.result()
+                yield result
+                if stoponfail and result.exitcode:
+                    return
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+def run(cmd, **kwargs):
+    """Runs the given shell command to completion, capturing its output, and
+    returns a ``RunResult``. Both output streams are drained together so the
+    command cannot stall on a full pipe. The process is reaped with
+    ``os.wait4()`` where available to collect its resource usage.
+
+    **Examples**:
+    ::
+        result = auxly.shell.run("make")
+        result.exitcode, result.stdout, result.duration, result.maxrss
+    """
+    start = _clock()
     kwargs['shell'] = True
     kwargs['stdout'] = subprocess.PIPE
     kwargs['stderr'] = subprocess.PIPE
-    if sys.version_info >= (3,0):
-        with subprocess.Popen(cmd, **kwargs) as proc:
-            for line in _readline(): yield line
-    else:
-        proc = subprocess.Popen(cmd, **kwargs)
-        for line in _readline(): yield line
-        proc.kill()
+    proc = subprocess.Popen(cmd, **kwargs)
+    pipes = {'out': proc.stdout, 'err': proc.stderr}
+    chunks = {'out': [], 'err': []}
+    try:
+        for std, data in _readblocks(pipes):
+            chunks[std].append(data)
+    finally:
+        for pipe in pipes.values():
+            pipe.close()
+    usage = None
+    if hasattr(os, "wait4"):
+        try:
+            _, status, usage = os.wait4(proc.pid, 0)
+            if os.WIFSIGNALED(status):
+                proc.returncode = -os.WTERMSIG(status)
+            else:
+                proc.returncode = os.WEXITSTATUS(status)
+        except OSError:
+            usage = None
+    if usage is None:
+        proc.wait()
+    duration = _clock() - start
+    out = b"".join(chunks['out']).decode("UTF-8", "replace")
+    err = b"".join(chunks['err']).decode("UTF-8", "replace")
+    if usage is None:
+        return RunResult(cmd, proc.returncode, out, err, duration, None, None, None)
+    # NOTE: The peak RSS is reported in kilobytes except on macOS.
+    maxrss = usage.ru_maxrss if "darwin" == sys.platform else usage.ru_maxrss * 1024
+    return RunResult(cmd, proc.returncode, out, err, duration,
+            usage.ru_utime, usage.ru_stime, maxrss)
+
+def iterstd(cmd, std="out", **kwargs):
+    """Iterates through the lines of a stderr/stdout stream for the given shell
+    command. The other stream is discarded."""
+    for _, line in _iterpipes(cmd, [std], **kwargs):
+        yield line
+
+def iterboth(cmd, merge=False, **kwargs):
+    """Iterates through the lines of both the stdout and stderr streams of the
+    given shell command as they are written, yielding (stream, line) where
+    stream is `out` or `err`. Both pipes are drained together so a command
+    writing heavily to one of them cannot stall. If `merge` is true, stderr
+    is redirected into stdout and all lines are yielded as `out`.
+
+    **Examples**:
+    ::
+        for std, line in auxly.shell.iterboth("make"):
+            print(std, line)
+    """
+    if merge:
+        kwargs['stderr'] = subprocess.STDOUT
+        return _iterpipes(cmd, ["out"], **kwargs)
+    return _iterpipes(cmd, ["out", "err"], **kwargs)
+
+def _iterpipes(cmd, stds, **kwargs):
+    """Runs the given shell command with the given streams piped and yields
+    (stream, line) for their decoded lines. Streams that are not piped are
+    discarded unless redirected in the keyword arguments."""
+    kwargs['shell'] = True
+    for std in ["out", "err"]:
+        if std in stds:
+            kwargs['std' + std] = subprocess.PIPE
+        else:
+            kwargs.setdefault('std' + std, NULL)
+    proc = subprocess.Popen(cmd, **kwargs)
+    pipes = dict((std, getattr(proc, "std" + std)) for std in stds)
+    reader = _readpipes(pipes)
+    try:
+        for std, line in reader:
+            yield std, line.rstrip().decode("UTF-8", "replace")
+    finally:
+        reader.close()
+        if proc.poll() is None:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+        for pipe in pipes.values():
+            pipe.close()
+        proc.wait()
+
+def _readpipes(pipes):
+    """Yields (name, line) for the raw lines read from the given dict of names
+    to pipes until all of them are closed."""
+    partial = dict((name, b"") for name in pipes)
+    for name, data in _readblocks(pipes):
+        if not data:
+            if partial[name]:
+                yield name, partial[name]
+            continue
+        lines = (partial[name] + data).split(b"\n")
+        partial[name] = lines.pop()
+        for line in lines:
+            yield name, line
+
+def _readblocks(pipes):
+    """Yields (name, block) for the data read from the given dict of names to
+    pipes in large blocks as it arrives on any of them, and (name, b"") once
+    a pipe is closed. Where pipes cannot be selected (Windows or no
+    ``selectors`` module) a thread reads each pipe instead."""
+    if selectors is None or auxly.iswindows():
+        for item in _readthreaded(pipes):
+            yield item
+        return
+    sel = selectors.DefaultSelector()
+    try:
+        for name, pipe in pipes.items():
+            sel.register(pipe, selectors.EVENT_READ, name)
+        while sel.get_map():
+            for key, _ in sel.select():
+                data = os.read(key.fd, _PIPESIZE)
+                if not data:
+                    sel.unregister(key.fileobj)
+                yield key.data, data
+    finally:
+        sel.close()
+
+def _readthreaded(pipes):
+    """Same as ``_readblocks()`` using a reader thread per pipe."""
+    blocks = queue.Queue()
+    def reader(name, pipe):
+        read = pipe.read1 if hasattr(pipe, "read1") else pipe.readline
+        try:
+            while True:
+                data = read(_PIPESIZE)
+                if not data:
+                    break
+                blocks.put((name, data))
+        except (IOError, OSError, ValueError):
+            # NOTE: The pipe was closed by the consumer.
+            pass
+        finally:
+            blocks.put((name, b""))
+    for name, pipe in pipes.items():
+        thread = threading.Thread(target=reader, args=(name, pipe))
+        thread.daemon = True
+        thread.start()
+    remaining = len(pipes)
+    while remaining:
+        name, data = blocks.get()
+        if not data:
+            remaining -= 1
+        yield name, data
 
 ##--------------------------------------------------------------#
 ## Stdout related functions.                                    #
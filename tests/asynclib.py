@@ -0,0 +1,41 @@
+"""Coroutines used by the asyncio shell tests. Only imported on Python 3.7+
+since the syntax is not valid on Python 2."""
+
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import asyncio
+
+import auxly.shell
+
+##==============================================================#
+## SECTION: Function Definitions                                #
+##==============================================================#
+
+def run(coro):
+    """Runs the given coroutine to completion and returns its result."""
+    return asyncio.run(coro)
+
+async def silents(*cmds):
+    return await asyncio.gather(*[auxly.shell.asilent(cmd) for cmd in cmds])
+
+async def outputs(cmd):
+    lines = []
+    async for line in auxly.shell.aiterout(cmd):
+        lines.append(line)
+    return lines, await auxly.shell.astrout(cmd), await auxly.shell.astrerr(cmd)
+
+async def startwait(cmd):
+    p = await auxly.shell.astart(cmd)
+    return await p.wait(), p.isrunning(), p.exitcode()
+
+async def startstop(cmd):
+    p = await auxly.shell.astart(cmd)
+    running = p.isrunning()
+    p.stop()
+    await p.wait()
+    return running, p.isrunning()
+
+async def listout(cmd):
+    return await auxly.shell.alistout(cmd)
@@ -0,0 +1,59 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import PathFilter, delete, walkdirs, walkfiles
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        fwrite(op.join(DIR[0], "a.py"), TEXT[0])
+        fwrite(op.join(DIR[0], "b.txt"), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], "c.py"), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[2], "d.py"), TEXT[0])
+
+    def test_pathfilter_1(test):
+        """Basic PathFilter matching."""
+        pf = PathFilter(ext=".py")
+        test.assertTrue(pf.match("foo/a.py"))
+        test.assertFalse(pf.match("foo/b.txt"))
+        pf = PathFilter(glob=["a*", "b.txt"], exclude="*.txt")
+        test.assertTrue(pf.match("foo/a.py"))
+        test.assertFalse(pf.match("foo/b.txt"))
+        test.assertFalse(pf.match("foo/c.py"))
+        pf = PathFilter(regex="^foo", entire=False)
+        test.assertTrue(pf.match("bar/foo.txt"))
+        test.assertFalse(pf.match("foo/bar.txt"))
+        test.assertTrue(pf.excludes("x") == False)
+
+    def test_pathfilter_2(test):
+        """Walkers accept a PathFilter and do not recurse into excluded dirs."""
+        pf = PathFilter(ext="py", exclude=DIR[2])
+        found = sorted(f.name for f in walkfiles(DIR[0], pf, recurse=True))
+        test.assertEqual(["a.py", "c.py"], found)
+        found = [d.name for d in walkdirs(DIR[0], PathFilter(exclude=DIR[2]), recurse=True)]
+        test.assertEqual([DIR[1]], found)
+
+    def test_pathfilter_3(test):
+        """Delete accepts a PathFilter."""
+        deleted = delete(DIR[0], PathFilter(ext=".py", exclude=DIR[1]), recurse=True)
+        test.assertEqual(2, len(deleted))
+        test.assertTrue(op.isfile(op.join(DIR[0], DIR[1], "c.py")))
+        test.assertTrue(op.isfile(op.join(DIR[0], "b.txt")))
+
+    def test_pathfilter_4(test):
+        """Invalid regex patterns match nothing."""
+        test.assertEqual([], list(walkfiles(DIR[0], "(", recurse=True)))
+        test.assertEqual([], delete(DIR[0], "(", recurse=True))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import Dir, Progress, iterdelete, walkall, walkfiles
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        for i in DIR:
+            for j in DIR:
+                fwrite(op.join(DIR[0], i, j, FNAME[0]), TEXT[0])
+                fwrite(op.join(DIR[0], i, j, FNAME[1]), TEXT[1])
+            fwrite(op.join(DIR[0], i, FNAME[0]), TEXT[0])
+
+    def test_parallel_1(test):
+        """Unordered parallel walks find the same entries as serial walks."""
+        serial = list(walkall(DIR[0], recurse=True))
+        parallel = list(walkall(DIR[0], recurse=True, workers=4))
+        test.assertEqual(len(serial), len(parallel))
+        test.assertEqual(sorted(serial), sorted(parallel))
+
+    def test_parallel_2(test):
+        """Ordered parallel walks yield entries in the serial order."""
+        serial = list(walkfiles(DIR[0], regex=".txt$", recurse=True))
+        test.assertEqual(36, len(serial))
+        for _ in range(3):
+            test.assertEqual(serial, list(walkfiles(DIR[0], regex=".txt$", recurse=True, workers=3, ordered=True)))
+
+    def test_parallel_3(test):
+        """Parallel walks can be stopped early."""
+        walk = Dir(DIR[0]).walkfiles(recurse=True, workers=2)
+        test.assertTrue(op.isfile(next(walk)))
+        walk.close()
+
+    def test_parallel_4(test):
+        """Errors raised in worker threads reach the consumer."""
+        def callback(status):
+            raise ValueError("stop")
+        with test.assertRaises(ValueError):
+            list(iterdelete(DIR[0], ".txt$", recurse=True, workers=2, progress=Progress(callback, 0)))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import Dir, countall, countdirs, countfiles, getsize, treestats
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], FNAME[0]), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], FNAME[1]), TEXT[1] * 2)
+        makedirs(op.join(DIR[0], DIR[2]))
+
+    def test_treestats_1(test):
+        """Non-recursive stats."""
+        stats = treestats(DIR[0])
+        test.assertEqual(1, stats.files)
+        test.assertEqual(2, stats.dirs)
+        test.assertEqual(len(TEXT[0]), stats.size)
+        test.assertEqual(0, stats.errors)
+
+    def test_treestats_2(test):
+        """Recursive stats, optionally with workers."""
+        size = len(TEXT[0]) * 2 + len(TEXT[1]) * 2
+        for workers in [None, 3]:
+            stats = Dir(DIR[0]).treestats(recurse=True, workers=workers)
+            test.assertEqual((3, 2, size, 0, 0), tuple(stats))
+
+    def test_treestats_3(test):
+        """Count and size functions agree with the stats."""
+        test.assertEqual(3, countall(DIR[0]))
+        test.assertEqual(5, countall(DIR[0], recurse=True))
+        test.assertEqual(3, countfiles(DIR[0], recurse=True))
+        test.assertEqual(2, countdirs(DIR[0], recurse=True))
+        test.assertEqual(treestats(DIR[0], recurse=True).size, getsize(DIR[0], recurse=True))
+        test.assertEqual(0, countall("not_a_real_dir"))
+        test.assertEqual((0, 0, 0, 0, 0), tuple(treestats("not_a_real_dir")))
+        test.assertEqual(len(TEXT[0]), treestats(op.join(DIR[0], FNAME[0])).size)
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
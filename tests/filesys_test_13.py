@@ -0,0 +1,70 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import time
+
+from testlib import *
+
+from auxly.filesys import Dir, Snapshot
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+INDEX = op.join(DIR[3], "index.snap")
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], FNAME[1]), TEXT[1])
+
+    def test_snapshot_1(test):
+        """Initial scan reports everything as added."""
+        changes = Snapshot(DIR[0]).scan()
+        test.assertEqual(3, len(changes.added))
+        test.assertEqual([], changes.removed)
+        test.assertEqual([], changes.modified)
+
+    def test_snapshot_2(test):
+        """Rescans from a saved index only report changes."""
+        test.assertEqual(3, len(Dir(DIR[0]).snapshot(INDEX).scan().added))
+        test.assertTrue(op.isfile(INDEX))
+        snap = Snapshot(DIR[0], INDEX)
+        test.assertEqual(3, len(snap))
+        test.assertEqual(([], [], []), tuple(snap.scan()))
+        time.sleep(0.01)
+        fwrite(op.join(DIR[0], DIR[1], FNAME[0]), TEXT[0])
+        delete(op.join(DIR[0], FNAME[0]))
+        changes = Snapshot(DIR[0], INDEX).scan()
+        test.assertEqual([op.abspath(op.join(DIR[0], DIR[1], FNAME[0]))], changes.added)
+        test.assertEqual([op.abspath(op.join(DIR[0], FNAME[0]))], changes.removed)
+        test.assertEqual([], changes.modified)
+
+    def test_snapshot_3(test):
+        """In-place modifications are found when checking files."""
+        snap = Snapshot(DIR[0])
+        snap.scan()
+        fwrite(op.join(DIR[0], DIR[1], FNAME[1]), TEXT[1] * 2)
+        changes = snap.scan(checkfiles=True)
+        test.assertEqual([op.abspath(op.join(DIR[0], DIR[1], FNAME[1]))], changes.modified)
+
+    def test_snapshot_4(test):
+        """Removed directories report their contents as removed."""
+        snap = Snapshot(DIR[0])
+        snap.scan()
+        delete(op.join(DIR[0], DIR[1]))
+        changes = snap.scan()
+        test.assertEqual(2, len(changes.removed))
+        test.assertEqual(1, len(snap))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
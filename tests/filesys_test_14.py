@@ -0,0 +1,59 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import Dir, File, walkall
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_stat_1(test):
+        """Stat results are cached until refreshed."""
+        fwrite(FNAME[0], TEXT[0])
+        f = File(FNAME[0])
+        test.assertEqual(len(TEXT[0]), f.size())
+        with open(FNAME[0], "a") as fo:
+            fo.write(TEXT[1])
+        test.assertEqual(len(TEXT[0]), f.size())
+        f.refresh()
+        test.assertEqual(len(TEXT[0] + TEXT[1]), f.size())
+        test.assertEqual(os.stat(FNAME[0]).st_mtime, f.stat(refresh=True).st_mtime)
+
+    def test_stat_2(test):
+        """Writes through the object discard the cached stat."""
+        f = File(FNAME[0])
+        test.assertEqual(None, f.stat())
+        test.assertEqual(None, f.size())
+        test.assertTrue(f.write(TEXT[0]))
+        test.assertEqual(len(TEXT[0]), f.size())
+        test.assertTrue(f.append(TEXT[1]))
+        test.assertEqual(len(TEXT[0] + TEXT[1]), f.size())
+        test.assertTrue(f.delete())
+        test.assertEqual(None, f.size())
+
+    def test_stat_3(test):
+        """Walked objects are seeded from the directory entries."""
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0])
+        makedirs(op.join(DIR[0], DIR[1]))
+        found = list(walkall(DIR[0]))
+        test.assertEqual(2, len(found))
+        for p in found:
+            test.assertEqual(os.stat(p).st_size, p.stat().st_size)
+            test.assertEqual(op.abspath(p), p.path)
+            if isinstance(p, File):
+                test.assertEqual(len(TEXT[0]), p.size())
+                test.assertTrue(p.isfile())
+            else:
+                test.assertTrue(isinstance(p, Dir))
+                test.assertTrue(p.isdir())
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import hashlib
+
+from testlib import *
+
+from auxly.filesys import File, checksum, checksums
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+HELLO_MD5 = "5d41402abc4b2a76b9719d911017c592"
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_checksum_1(test):
+        """Block size does not affect the checksum."""
+        fwrite(FNAME[0], TEXT[0])
+        test.assertEqual(HELLO_MD5, checksum(FNAME[0]))
+        test.assertEqual(HELLO_MD5, checksum(FNAME[0], blocksize=2))
+        test.assertEqual(HELLO_MD5, File(FNAME[0]).checksum(blocksize=3))
+
+    def test_checksum_2(test):
+        """Hashers can be given as objects, names or constructors."""
+        fwrite(FNAME[0], TEXT[0])
+        sha = hashlib.sha256(TEXT[0].encode()).hexdigest()
+        test.assertEqual(sha, checksum(FNAME[0], hashlib.sha256()))
+        test.assertEqual(sha, checksum(FNAME[0], "sha256"))
+        test.assertEqual(sha, checksum(FNAME[0], hashlib.sha256))
+
+    def test_checksums_1(test):
+        """Bulk checksums match single checksums."""
+        paths = []
+        for i in range(20):
+            path = op.join(DIR[0], "%d.txt" % i)
+            fwrite(path, TEXT[i % 2] * i)
+            paths.append(path)
+        paths.append(op.join(DIR[0], "not_a_real_file.txt"))
+        for workers in [1, 4]:
+            results = dict(checksums(paths, workers=workers))
+            test.assertEqual(sorted(paths), sorted(results))
+            for path in paths[:-1]:
+                test.assertEqual(checksum(path), results[path])
+            test.assertEqual(None, results[paths[-1]])
+
+    def test_checksums_2(test):
+        """A hasher object is copied for each file."""
+        fwrite(FNAME[0], TEXT[0])
+        fwrite(FNAME[1], TEXT[0])
+        results = list(checksums(FNAME, hashlib.md5(), workers=2))
+        test.assertEqual([HELLO_MD5, HELLO_MD5], [r[1] for r in results])
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
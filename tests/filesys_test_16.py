@@ -0,0 +1,89 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import gc
+import weakref
+
+from testlib import *
+
+from auxly.filesys import ChecksumCache, File, checksum, checksums
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+DBPATH = op.join(DIR[3], "checksums.db")
+
+#: Whole-second file time that round-trips exactly on all versions.
+MTIME = 1500000000
+
+##==============================================================#
+## SECTION: Function Definitions                                #
+##==============================================================#
+
+def rewrite(path, text):
+    """Rewrites the file content while keeping the same size and the times
+    set to ``MTIME``."""
+    with open(path, "r+") as fo:
+        fo.write(text)
+    os.utime(path, (MTIME, MTIME))
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_cache_1(test):
+        """Unchanged files are not read again."""
+        fwrite(FNAME[0], TEXT[0])
+        os.utime(FNAME[0], (MTIME, MTIME))
+        cache = ChecksumCache()
+        digest = checksum(FNAME[0], cache=cache)
+        test.assertEqual(1, len(cache))
+        rewrite(FNAME[0], TEXT[1][:len(TEXT[0])])
+        test.assertEqual(digest, checksum(FNAME[0], cache=cache))
+        test.assertNotEqual(digest, checksum(FNAME[0]))
+        test.assertNotEqual(digest, checksum(FNAME[0], "sha1", cache=cache))
+        test.assertEqual(2, len(cache))
+        os.utime(FNAME[0], None)
+        fwrite(FNAME[0], TEXT[1])
+        test.assertEqual(checksum(FNAME[0]), File(FNAME[0]).checksum(cache=cache))
+        cache.close()
+
+    def test_cache_2(test):
+        """Cache is persisted and bounded."""
+        paths = []
+        for i in range(3):
+            path = op.join(DIR[0], "%d.txt" % i)
+            fwrite(path, TEXT[0] * (i + 1))
+            paths.append(path)
+        with ChecksumCache(DBPATH, maxsize=2) as cache:
+            results = dict(checksums(paths, cache=cache, workers=2))
+            test.assertEqual(2, len(cache))
+        with ChecksumCache(DBPATH, maxsize=2) as cache:
+            test.assertEqual(2, len(cache))
+            hits = [p for p in paths if cache.get(p, "md5")]
+            test.assertEqual(2, len(hits))
+            for path in hits:
+                test.assertEqual(results[path], checksum(path, cache=cache))
+
+    def test_cache_3(test):
+        """Caches are not kept alive until exit and save changes when
+        collected."""
+        fwrite(FNAME[0], TEXT[0])
+        cache = ChecksumCache(DBPATH)
+        digest = checksum(FNAME[0], asbytes=True, cache=cache)
+        ref = weakref.ref(cache)
+        del cache
+        gc.collect()
+        test.assertEqual(None, ref())
+        with ChecksumCache(DBPATH) as cache:
+            test.assertEqual(digest, cache.get(FNAME[0], "md5"))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
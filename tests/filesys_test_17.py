@@ -0,0 +1,48 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import Dir, duplicates
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+BIG = "x" * 0x3000
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        fwrite(op.join(DIR[0], "a.txt"), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], "a.txt"), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], "b.txt"), TEXT[1])
+        fwrite(op.join(DIR[0], "big1.txt"), BIG)
+        fwrite(op.join(DIR[0], DIR[2], "big2.txt"), BIG)
+        fwrite(op.join(DIR[0], DIR[2], "big3.txt"), BIG[:0x1800] + "y" + BIG[0x1801:])
+        fwrite(op.join(DIR[0], DIR[2], "empty1.txt"), "")
+        fwrite(op.join(DIR[0], DIR[2], "empty2.txt"), "")
+
+    def test_duplicates_1(test):
+        """Duplicates are grouped; files differing only in the middle are not."""
+        for workers in [None, 3]:
+            groups = sorted(sorted(f.name for f in g) for g in duplicates(DIR[0], workers=workers))
+            test.assertEqual([["a.txt", "a.txt"], ["big1.txt", "big2.txt"]], groups)
+
+    def test_duplicates_2(test):
+        """Options are honored."""
+        test.assertEqual([], list(duplicates(DIR[0], recurse=False)))
+        groups = list(Dir(DIR[0]).duplicates(minsize=0, regex="empty"))
+        test.assertEqual(1, len(groups))
+        test.assertEqual(2, len(groups[0]))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import Dir, sync
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[2], FNAME[1]), TEXT[1])
+        makedirs(op.join(DIR[0], DIR[3]))
+
+    def test_sync_1(test):
+        """Initial sync copies everything; later syncs copy nothing."""
+        result = sync(DIR[0], DIR[1])
+        test.assertEqual(2, len(result.copied))
+        test.assertEqual(TEXT[0], fread(op.join(DIR[1], FNAME[0])))
+        test.assertEqual(TEXT[1], fread(op.join(DIR[1], DIR[2], FNAME[1])))
+        test.assertTrue(op.isdir(op.join(DIR[1], DIR[3])))
+        test.assertEqual(([], [], []), tuple(sync(DIR[0], DIR[1])))
+        test.assertEqual(([], [], []), tuple(Dir(DIR[0]).sync(DIR[1], verify=True)))
+
+    def test_sync_2(test):
+        """Only changed files are copied; extras are purged on request."""
+        sync(DIR[0], DIR[1])
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0] * 2)
+        fwrite(op.join(DIR[1], DIR[2], FNAME[0]), TEXT[0])
+        result = sync(DIR[0], DIR[1], test=True)
+        test.assertEqual([op.abspath(op.join(DIR[1], FNAME[0]))], result.copied)
+        test.assertEqual([], result.deleted)
+        test.assertEqual(TEXT[0], fread(op.join(DIR[1], FNAME[0])))
+        result = sync(DIR[0], DIR[1], purge=True)
+        test.assertEqual([op.abspath(op.join(DIR[1], FNAME[0]))], result.copied)
+        test.assertEqual([op.abspath(op.join(DIR[1], DIR[2], FNAME[0]))], result.deleted)
+        test.assertEqual(TEXT[0] * 2, fread(op.join(DIR[1], FNAME[0])))
+        test.assertFalse(op.exists(op.join(DIR[1], DIR[2], FNAME[0])))
+
+    def test_sync_3(test):
+        """Nothing happens for a missing source."""
+        test.assertEqual(([], [], []), tuple(sync("not_a_real_dir", DIR[1])))
+        test.assertFalse(op.exists(DIR[1]))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
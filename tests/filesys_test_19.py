@@ -0,0 +1,59 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+import shutil
+
+from auxly.filesys import copy, walkfiles
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        for i in range(10):
+            fwrite(op.join(DIR[0], DIR[i % 3], "%d.txt" % i), TEXT[i % 2] * (i * 1000))
+        os.makedirs(op.join(DIR[0], "empty.dir"))
+        fwrite(op.join(DIR[0], "sub.dir", FNAME[0]), TEXT[0])
+
+    def test_copy_1(test):
+        """Parallel directory copies match the source."""
+        test.assertTrue(copy(DIR[0], DIR[3], workers=4))
+        count = 0
+        for f in walkfiles(DIR[0], recurse=True):
+            dst = op.join(DIR[3], op.relpath(f, op.abspath(DIR[0])))
+            test.assertEqual(fread(f), fread(dst))
+            test.assertEqual(int(os.stat(f).st_mtime), int(os.stat(dst).st_mtime))
+            count += 1
+        test.assertEqual(11, count)
+        test.assertTrue(op.isdir(op.join(DIR[3], "empty.dir")))
+
+    def test_copy_2(test):
+        """Directory copies respect the overwrite flag."""
+        test.assertTrue(copy(DIR[0], DIR[3]))
+        fwrite(op.join(DIR[3], FNAME[0]), TEXT[1])
+        test.assertFalse(copy(DIR[0], DIR[3], overwrite=False, workers=2))
+        test.assertTrue(copy(op.join(DIR[0], "sub.dir", FNAME[0]), DIR[3]))
+        test.assertEqual(TEXT[0], fread(op.join(DIR[3], FNAME[0])))
+
+    def test_copy_3(test):
+        """Copying a file onto itself raises and leaves the file intact."""
+        path = op.join(DIR[0], "sub.dir", FNAME[0])
+        test.assertRaises(shutil.Error, copy, path, path)
+        test.assertRaises(shutil.Error, copy, path, op.dirname(path))
+        test.assertEqual(TEXT[0], fread(path))
+        if hasattr(os, "link"):
+            link = op.join(DIR[0], "link.txt")
+            os.link(path, link)
+            test.assertRaises(shutil.Error, copy, path, link)
+            test.assertEqual(TEXT[0], fread(path))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
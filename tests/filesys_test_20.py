@@ -0,0 +1,66 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+import auxly.filesys
+from auxly.filesys import Progress, checksum, checksums, copy, delete, move
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        test.statuses = []
+        for i in range(4):
+            fwrite(op.join(DIR[0], DIR[i % 2], "%d.txt" % i), TEXT[0])
+
+    def test_progress_1(test):
+        """Copies report files and bytes done."""
+        test.assertTrue(copy(DIR[0], DIR[1], workers=2, progress=test.statuses.append))
+        final = test.statuses[-1]
+        test.assertEqual(4, final.files)
+        test.assertEqual(4 * len(TEXT[0]), final.bytes)
+        test.assertTrue(final.rate >= 0)
+
+    def test_progress_2(test):
+        """Callbacks are throttled but always report the final totals."""
+        progress = Progress(test.statuses.append, interval=60)
+        list(checksums([op.join(DIR[0], DIR[i % 2], "%d.txt" % i) for i in range(4)], progress=progress))
+        test.assertEqual(1, len(test.statuses))
+        test.assertEqual((4, 4 * len(TEXT[0])), test.statuses[0][:2])
+        progress = Progress(test.statuses.append, interval=0)
+        checksum(op.join(DIR[0], DIR[0], "0.txt"), blocksize=1, progress=progress)
+        test.assertEqual(len(TEXT[0]) + 2, len(test.statuses) - 1)
+
+    def test_progress_3(test):
+        """Deletes and moves report files done."""
+        deleted = delete(DIR[0], ".txt$", recurse=True, test=True, progress=test.statuses.append)
+        test.assertEqual(4, len(deleted))
+        test.assertEqual(4, test.statuses[-1].files)
+        test.assertTrue(move(DIR[0], DIR[2], progress=test.statuses.append))
+        test.assertEqual(1, test.statuses[-1].files)
+        test.assertEqual(op.abspath(DIR[0]), test.statuses[-1].path)
+
+    def test_progress_4(test):
+        """Bytes of a failed kernel copy are not counted twice."""
+        def failing(infd, outfd, update):
+            update(3)
+            return False
+        kernelcopy = auxly.filesys._kernelcopy
+        auxly.filesys._kernelcopy = failing
+        try:
+            test.assertTrue(copy(op.join(DIR[0], DIR[0], "0.txt"), FNAME[0], progress=test.statuses.append))
+        finally:
+            auxly.filesys._kernelcopy = kernelcopy
+        test.assertEqual((1, len(TEXT[0])), test.statuses[-1][:2])
+        test.assertEqual(TEXT[0], fread(FNAME[0]))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly.filesys import PathFilter, countfiles, delete, iterdelete
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        for i in range(12):
+            fwrite(op.join(DIR[0], DIR[i % 3], "%d.%s" % (i, "tmp" if i % 2 else "txt")), TEXT[0])
+
+    def test_iterdelete_1(test):
+        """Deleted paths are streamed."""
+        deleting = iterdelete(DIR[0], ".tmp$", recurse=True)
+        first = next(deleting)
+        test.assertTrue(first.endswith(".tmp"))
+        test.assertFalse(op.exists(first))
+        rest = list(deleting)
+        test.assertEqual(5, len(rest))
+        test.assertEqual(6, countfiles(DIR[0], recurse=True))
+
+    def test_iterdelete_2(test):
+        """Test runs and workers."""
+        found = sorted(iterdelete(DIR[0], PathFilter(ext=".txt"), recurse=True, test=True))
+        test.assertEqual(6, len(found))
+        test.assertTrue(all(op.isfile(f) for f in found))
+        test.assertEqual(found, sorted(iterdelete(DIR[0], PathFilter(ext=".txt"), recurse=True, workers=3)))
+        test.assertFalse(any(op.exists(f) for f in found))
+        test.assertTrue(op.isdir(op.join(DIR[0], DIR[1])))
+
+    def test_iterdelete_3(test):
+        """Non-recursive and single file deletes."""
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0])
+        test.assertEqual([op.join(DIR[0], FNAME[0])], list(iterdelete(DIR[0])))
+        path = op.join(DIR[0], DIR[0], "0.txt")
+        test.assertEqual([path], list(iterdelete(path)))
+        test.assertEqual([], list(iterdelete(path)))
+        test.assertEqual(5, len(delete(DIR[0], ".txt$", recurse=True)))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+from testlib import *
+
+from auxly import AuxlyError
+from auxly.filesys import File
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+UTF8_STR = u"ÁÍÓÚÀÈÌÒÙAEIOU"
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_iterlines_1(test):
+        """Lines are streamed with or without endings."""
+        f = File(FNAME[0])
+        test.assertEqual([], list(f.iterlines()))
+        test.assertTrue(f.write("\n".join(TEXT + [UTF8_STR]) + "\n"))
+        test.assertEqual(f.splitlines(), list(f.iterlines()))
+        test.assertEqual(f.readlines(), list(f.iterlines(keepends=True)))
+
+    def test_iterlines_2(test):
+        """Errors are yielded as the final item."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write(UTF8_STR))
+        lines = list(f.iterlines(encoding="ascii"))
+        test.assertEqual(1, len(lines))
+        test.assertEqual(AuxlyError, type(lines[-1]))
+
+    def test_iterchunks_1(test):
+        """Chunks are streamed as text or bytes."""
+        f = File(FNAME[0])
+        test.assertEqual([], list(f.iterchunks()))
+        test.assertTrue(f.write(UTF8_STR))
+        chunks = list(f.iterchunks(4))
+        test.assertEqual(4, len(chunks))
+        test.assertEqual(UTF8_STR, "".join(chunks))
+        test.assertEqual(UTF8_STR.encode("utf-8"), b"".join(f.iterchunks(3, binary=True)))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import re
+
+from testlib import *
+
+from auxly.filesys import File, checksum
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_mmap_1(test):
+        """Mapped content supports regex searches and views."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write(" ".join(TEXT)))
+        with f.mmap() as data:
+            test.assertEqual(len(" ".join(TEXT)), len(data))
+            test.assertEqual(6, re.search(TEXT[1].encode(), data).start())
+            test.assertEqual(TEXT[0].encode(), data[:5])
+            if hasattr(memoryview, "release"):
+                view = memoryview(data)
+                test.assertEqual(TEXT[0].encode(), view[:5].tobytes())
+                view.release()
+
+    def test_mmap_2(test):
+        """Missing and empty files."""
+        f = File(FNAME[0])
+        with f.mmap() as data:
+            test.assertEqual(None, data)
+        test.assertTrue(f.empty())
+        with f.mmap() as data:
+            test.assertEqual(b"", data)
+
+    def test_mmap_3(test):
+        """Mapped checksums match regular checksums."""
+        fwrite(FNAME[0], TEXT[0] * 1000)
+        test.assertEqual(checksum(FNAME[0]), checksum(FNAME[0], mapped=True, blocksize=7))
+        fwrite(FNAME[1], "")
+        test.assertEqual(checksum(FNAME[1]), File(FNAME[1]).checksum(mapped=True))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+import time
+
+from testlib import *
+
+from auxly.filesys import File
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_writer_1(test):
+        """Writer replaces content; appender preserves it."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write("old"))
+        with f.writer() as fw:
+            for t in TEXT:
+                test.assertTrue(fw.writeline(t))
+        test.assertEqual(os.linesep.join(TEXT) + os.linesep, fread(FNAME[0]))
+        with f.appender() as fa:
+            test.assertTrue(fa.append(TEXT[0]))
+        test.assertEqual(os.linesep.join(TEXT) + os.linesep + TEXT[0], fread(FNAME[0]))
+
+    def test_writer_2(test):
+        """Content is buffered until flushed and the stat cache is refreshed."""
+        f = File(FNAME[0])
+        fw = f.appender(buffersize=0x10000, fsync="close")
+        test.assertTrue(fw.write(TEXT[0]))
+        test.assertEqual(0, f.size())
+        test.assertTrue(fw.flush())
+        test.assertEqual(len(TEXT[0]), f.size())
+        test.assertTrue(fw.close())
+        test.assertFalse(fw.write(TEXT[1]))
+
+    def test_writer_3(test):
+        """A zero flush interval flushes on every write."""
+        f = File(FNAME[0])
+        with f.appender(flushinterval=0, fsync="flush") as fa:
+            fa.write(TEXT[0])
+            test.assertEqual(TEXT[0], fread(FNAME[0]))
+
+    def test_writer_4(test):
+        """Binary mode."""
+        f = File(FNAME[1])
+        with f.writer(binary=True) as fw:
+            test.assertTrue(fw.writeline(b"\x00\x01"))
+        with open(FNAME[1], "rb") as fi:
+            test.assertEqual(b"\x00\x01" + os.linesep.encode(), fi.read())
+
+    def test_writer_5(test):
+        """Content is flushed after the interval even without further
+        writes."""
+        f = File(FNAME[0])
+        with f.appender(flushinterval=0.1) as fa:
+            fa.write(TEXT[0])
+            test.assertEqual("", fread(FNAME[0]))
+            time.sleep(0.5)
+            test.assertEqual(TEXT[0], fread(FNAME[0]))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
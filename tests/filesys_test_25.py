@@ -0,0 +1,48 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+
+from testlib import *
+
+from auxly.filesys import File
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_ifchanged_1(test):
+        """Unchanged content is not rewritten."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write(TEXT[0], ifchanged=True))
+        os.utime(FNAME[0], (1000, 1000))
+        test.assertFalse(f.write(TEXT[0], ifchanged=True))
+        test.assertEqual(1000, int(os.path.getmtime(FNAME[0])))
+        test.assertTrue(f.write(TEXT[1], ifchanged=True))
+        test.assertEqual(TEXT[1], fread(FNAME[0]))
+
+    def test_ifchanged_2(test):
+        """Same size but different content is rewritten."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write("abcd"))
+        test.assertTrue(f.write("abce", ifchanged=True))
+        test.assertEqual("abce", fread(FNAME[0]))
+        test.assertTrue(f.writeline("abce", ifchanged=True))
+        test.assertFalse(f.writeline("abce", ifchanged=True))
+
+    def test_ifchanged_3(test):
+        """Binary content."""
+        f = File(FNAME[1])
+        test.assertTrue(f.write(b"\x00\x01", binary=True, ifchanged=True))
+        test.assertFalse(f.write(b"\x00\x01", binary=True, ifchanged=True))
+        test.assertTrue(f.write(b"", binary=True, ifchanged=True))
+        test.assertEqual(0, f.size())
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
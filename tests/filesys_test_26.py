@@ -0,0 +1,90 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+import threading
+import time
+
+from testlib import *
+
+from auxly.filesys import File, _Inotify
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_tail_1(test):
+        """Last lines are read from the end of the file."""
+        f = File(FNAME[0])
+        test.assertEqual([], f.tail())
+        test.assertTrue(f.write("\n".join(str(i) for i in range(5000)) + "\n"))
+        test.assertEqual(["4997", "4998", "4999"], f.tail(3))
+        test.assertEqual([], f.tail(0))
+        test.assertEqual(5000, len(f.tail(10000)))
+
+    def test_tail_2(test):
+        """A trailing partial line counts as a line."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write("a\r\nb\r\nc"))
+        test.assertEqual(["b", "c"], f.tail(2))
+
+    def test_follow_1(test):
+        """Appended lines are followed; partial lines wait for a line break."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write("a\nb\nc"))
+        def writer():
+            time.sleep(0.2)
+            f.append("d\ne\n")
+        thread = threading.Thread(target=writer)
+        thread.start()
+        result = list(f.follow(lines=1, interval=0.01, timeout=1))
+        thread.join()
+        test.assertEqual(["b", "cd", "e"], result)
+
+    def test_follow_2(test):
+        """Truncation and rotation are detected."""
+        f = File(FNAME[0])
+        test.assertTrue(f.write("old\n"))
+        def writer():
+            time.sleep(0.2)
+            f.write("n\n")
+            time.sleep(0.2)
+            fwrite(FNAME[1], "rotated\n")
+            os.rename(FNAME[1], FNAME[0])
+        thread = threading.Thread(target=writer)
+        thread.start()
+        result = list(f.follow(interval=0.01, timeout=1))
+        thread.join()
+        test.assertEqual(["n", "rotated"], result)
+
+    def test_follow_3(test):
+        """Missing files are waited for."""
+        f = File(FNAME[0])
+        def writer():
+            time.sleep(0.2)
+            fwrite(FNAME[0], "x\n")
+        thread = threading.Thread(target=writer)
+        thread.start()
+        result = list(f.follow(lines=5, interval=0.01, timeout=1))
+        thread.join()
+        test.assertEqual(["x"], result)
+
+class TestCasePolling(TestCase):
+    """Same tests without inotify."""
+    def setUp(test):
+        super(TestCasePolling, test).setUp()
+        test._libc = _Inotify._libc
+        _Inotify._libc = False
+
+    def tearDown(test):
+        _Inotify._libc = test._libc
+        super(TestCasePolling, test).tearDown()
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
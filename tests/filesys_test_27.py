@@ -0,0 +1,79 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import re
+
+from testlib import *
+
+from auxly.filesys import Dir, File, grep
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_grep_1(test):
+        """Matching lines are yielded with their line numbers."""
+        fwrite(op.join(DIR[0], FNAME[0]), "foo\r\nbar baz\nqux\nbaz")
+        fwrite(op.join(DIR[0], FNAME[1]), "nothing")
+        fwrite(op.join(DIR[0], DIR[1], FNAME[0]), "\nbaz")
+        fwrite(op.join(DIR[0], "baz.bin"), "baz")
+        result = sorted((op.relpath(f, DIR[0]), num, line) for f, num, line in grep(DIR[0], "baz", regex=r"\.txt$"))
+        test.assertEqual([
+            (op.join(DIR[1], FNAME[0]), 2, "baz"),
+            (FNAME[0], 2, "bar baz"),
+            (FNAME[0], 4, "baz")], result)
+        test.assertEqual(2, len(list(grep(DIR[0], "baz", regex=r"\.txt$", recurse=False))))
+
+    def test_grep_2(test):
+        """Only file names are yielded when requested."""
+        fwrite(op.join(DIR[0], FNAME[0]), "foo\nfoo\nfoo")
+        fwrite(op.join(DIR[0], FNAME[1]), "bar")
+        result = list(grep(DIR[0], "FO+", filesonly=True, flags=re.IGNORECASE, workers=4))
+        test.assertEqual([File(op.join(DIR[0], FNAME[0]))], result)
+
+    def test_grep_3(test):
+        """Binary and empty files are skipped; compiled patterns are accepted."""
+        fwrite(op.join(DIR[0], FNAME[0]), "")
+        makedirs(op.join(DIR[0], FNAME[1]))
+        with open(op.join(DIR[0], FNAME[1]), "wb") as fo:
+            fo.write(b"foo\x00foo")
+        test.assertEqual([], list(grep(DIR[0], re.compile("foo"))))
+
+    def test_grep_4(test):
+        """Searches from a Dir object; non-ASCII content."""
+        f = File(op.join(DIR[0], FNAME[0]))
+        test.assertTrue(f.write(u"caf\xe9\nno"))
+        result = list(Dir(DIR[0]).grep(u"\xe9"))
+        test.assertEqual([(f, 1, u"caf\xe9")], result)
+
+    def test_grep_5(test):
+        """Anchors match per line and matches do not span lines."""
+        path = op.join(DIR[0], FNAME[0])
+        fwrite(path, "foo\nbar\nfoo bar\n")
+        def lines(pattern):
+            return [num for _, num, _ in grep(DIR[0], pattern)]
+        test.assertEqual([1, 3], lines(r"^foo"))
+        test.assertEqual([2, 3], lines(r"bar$"))
+        test.assertEqual([3], lines(r"foo\s+bar"))
+        test.assertEqual([], list(grep(DIR[0], r"foo\nbar", filesonly=True)))
+
+    def test_grep_6(test):
+        """Empty matches do not report a line after the trailing line break."""
+        path = op.join(DIR[0], FNAME[0])
+        fwrite(path, "foo\nbar\n")
+        def lines(pattern):
+            return [num for _, num, _ in grep(DIR[0], pattern)]
+        test.assertEqual([1, 2], lines(r"^"))
+        test.assertEqual([1, 2], lines(r"o*$"))
+        test.assertEqual([], lines(r"^$"))
+        fwrite(path, "")
+        test.assertEqual([], lines(r"^"))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
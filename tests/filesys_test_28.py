@@ -0,0 +1,108 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+import threading
+import time
+
+from testlib import *
+
+from auxly.filesys import (Dir, WatchEvent, _IN_Q_OVERFLOW, _Inotify,
+        _InotifyWatcher, _coalesce, delete, watch)
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_watch_1(test):
+        """Created, modified and deleted files are reported once each."""
+        root = op.abspath(DIR[0])
+        fwrite(op.join(root, "a.txt"), "a")
+        fwrite(op.join(root, "c.txt"), "c")
+        def changer():
+            time.sleep(0.3)
+            fwrite(op.join(root, "b.txt"), "b")
+            with open(op.join(root, "a.txt"), "a") as fo:
+                fo.write("more")
+            os.remove(op.join(root, "c.txt"))
+            fwrite(op.join(root, DIR[1], "e.txt"), "e")
+            fwrite(op.join(root, "tmp.txt"), "tmp")
+            os.remove(op.join(root, "tmp.txt"))
+        thread = threading.Thread(target=changer)
+        thread.start()
+        events = list(Dir(root).watch(debounce=0.5, interval=0.05, checkfiles=True, timeout=1))
+        thread.join()
+        test.assertEqual(len(events), len(set(events)))
+        test.assertEqual(set([
+            WatchEvent("created", op.join(root, "b.txt")),
+            WatchEvent("modified", op.join(root, "a.txt")),
+            WatchEvent("deleted", op.join(root, "c.txt")),
+            WatchEvent("created", op.join(root, DIR[1])),
+            WatchEvent("created", op.join(root, DIR[1], "e.txt"))]), set(events))
+
+    def test_watch_2(test):
+        """Stops after the timeout when nothing changes."""
+        makedirs(op.join(DIR[0], FNAME[0]))
+        test.assertEqual([], list(watch(DIR[0], interval=0.05, timeout=0.2)))
+
+    def test_watch_3(test):
+        """Stops once the watched directory is deleted."""
+        root = op.abspath(DIR[0])
+        fwrite(op.join(root, FNAME[0]), TEXT[0])
+        def changer():
+            time.sleep(0.3)
+            delete(root)
+        thread = threading.Thread(target=changer)
+        thread.start()
+        events = list(watch(root, interval=0.05))
+        thread.join()
+        test.assertEqual(set([
+            WatchEvent("deleted", op.join(root, FNAME[0])),
+            WatchEvent("deleted", root)]), set(events))
+
+    def test_coalesce_1(test):
+        """Changes to the same path are merged."""
+        pending = {}
+        order = []
+        for kind, path in [("created", "a"), ("modified", "a"), ("modified", "b"),
+                ("deleted", "b"), ("created", "c"), ("deleted", "c"),
+                ("deleted", "d"), ("created", "d")]:
+            _coalesce(pending, order, kind, path)
+        test.assertEqual({'a': "created", 'b': "deleted", 'd': "modified"}, pending)
+
+    def test_overflow_1(test):
+        """Queue overflows are reported and the watches refreshed."""
+        if not _Inotify.available():
+            test.skipTest("requires inotify")
+        root = op.abspath(DIR[0])
+        makedirs(op.join(root, FNAME[0]))
+        watcher = _InotifyWatcher(root)
+        try:
+            os.mkdir(op.join(root, DIR[1]))
+            read = watcher._notify.read
+            watcher._notify.read = lambda: [(-1, _IN_Q_OVERFLOW, 0, "")]
+            test.assertEqual([("overflow", root)], watcher.poll(1))
+            watcher._notify.read = read
+            test.assertTrue(op.join(root, DIR[1]) in watcher._dirs.values())
+        finally:
+            watcher.close()
+
+class TestCasePolling(TestCase):
+    """Same tests without inotify."""
+    def setUp(test):
+        super(TestCasePolling, test).setUp()
+        test._libc = _Inotify._libc
+        _Inotify._libc = False
+
+    def tearDown(test):
+        _Inotify._libc = test._libc
+        super(TestCasePolling, test).tearDown()
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,13 +5,17 @@
 from testlib import *
 
 import auxly
-from auxly.filesys import cwd, isempty, makedirs, move
+from auxly.filesys import cwd, delete, isempty, makedirs, move
 
 ##==============================================================#
 ## SECTION: Class Definitions                                   #
 ##==============================================================#
 
 class TestCase(BaseTest):
+    def tearDown(test):
+        super(TestCase, test).tearDown()
+        delete(FNAME[0].upper())
+
     def test_move_1(test):
         """Regression check for release `0.3.0`; bug fix for deleting
         file if src and dst are the same."""
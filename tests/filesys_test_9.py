@@ -0,0 +1,74 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+
+from testlib import *
+
+from auxly.filesys import Dir, File, walkall, walkdirs, walkfiles
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        fwrite(op.join(DIR[0], FNAME[0]), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], FNAME[0]), TEXT[0])
+        fwrite(op.join(DIR[0], DIR[1], DIR[2], FNAME[1]), TEXT[1])
+        makedirs(op.join(DIR[0], DIR[3]))
+
+    def test_walk_1(test):
+        """Each entry is yielded exactly once when recursing."""
+        files = list(walkfiles(DIR[0], recurse=True))
+        dirs = list(walkdirs(DIR[0], recurse=True))
+        test.assertEqual(3, len(files))
+        test.assertEqual(3, len(set(files)))
+        test.assertEqual(3, len(dirs))
+        test.assertEqual(3, len(set(dirs)))
+        test.assertEqual(sorted(files + dirs), sorted(walkall(DIR[0], recurse=True)))
+
+    def test_walk_2(test):
+        """Walkers yield File/Dir objects with absolute paths."""
+        for f in walkfiles(DIR[0], recurse=True):
+            test.assertTrue(isinstance(f, File))
+            test.assertTrue(op.isabs(f))
+        for d in walkdirs(DIR[0], recurse=True):
+            test.assertTrue(isinstance(d, Dir))
+            test.assertTrue(op.isabs(d))
+
+    def test_walk_3(test):
+        """Regex on the name only is honored when recursing."""
+        found = list(walkfiles(DIR[0], regex="^" + FNAME[0] + "$", regex_entire=False, recurse=True))
+        test.assertEqual(2, len(found))
+        found = list(walkdirs(DIR[0], regex="^" + DIR[2] + "$", regex_entire=False, recurse=True))
+        test.assertEqual([op.abspath(op.join(DIR[0], DIR[1], DIR[2]))], found)
+
+    def test_walk_4(test):
+        """Non-recursive walks only list the start directory."""
+        test.assertEqual(1, len(list(walkfiles(DIR[0]))))
+        test.assertEqual(2, len(list(walkdirs(DIR[0]))))
+        test.assertEqual(3, len(list(Dir(DIR[0]).walkall())))
+        test.assertEqual([], list(walkfiles("not_a_real_dir", recurse=True)))
+
+    @unittest.skipIf(not hasattr(os, "symlink"), "requires symlinks")
+    def test_walk_5(test):
+        """Symlinked directories are yielded but not recursed into."""
+        try:
+            os.symlink(".", op.join(DIR[0], "loop"))
+        except (OSError, NotImplementedError):
+            return
+        files = list(walkfiles(DIR[0], recurse=True))
+        test.assertEqual(3, len(files))
+        test.assertEqual(len(files), len(set(files)))
+        test.assertTrue(op.abspath(op.join(DIR[0], "loop")) in walkdirs(DIR[0]))
+        for workers in (1, 4):
+            test.assertEqual(sorted(files), sorted(walkfiles(DIR[0], recurse=True, workers=workers)))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+import stat
+import sys
+
+from testlib import *
+
+from auxly.shell import has, hasall, which
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def setUp(test):
+        test._path = os.environ.get("PATH", "")
+
+    def tearDown(test):
+        os.environ['PATH'] = test._path
+        super(TestCase, test).tearDown()
+
+    def test_which_1(test):
+        """Executables added to a PATH directory are found."""
+        bindir = op.abspath(DIR[0])
+        makedirs(bindir)
+        os.environ['PATH'] = bindir
+        test.assertEqual(None, which("fakecmd"))
+        test.assertFalse(has("fakecmd", probe=False))
+        exe = op.join(bindir, "fakecmd")
+        open(exe, "w").close()
+        test.assertEqual(None, which("fakecmd"))
+        os.chmod(exe, stat.S_IRWXU)
+        os.utime(bindir, (1, 1))
+        test.assertEqual(exe, which("fakecmd"))
+        test.assertTrue(has("fakecmd"))
+        test.assertEqual(exe, which(exe))
+
+    def test_hasall_1(test):
+        """Batch lookups."""
+        pydir = op.dirname(op.realpath(sys.executable))
+        pyname = op.basename(op.realpath(sys.executable))
+        os.environ['PATH'] = pydir
+        test.assertTrue(hasall([pyname]))
+        test.assertFalse(hasall([pyname, "fakecmd"]))
+        test.assertTrue(hasall([]))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import sys
+
+from testlib import *
+
+from auxly.shell import ThreadPoolExecutor, runmany
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+PY = '"%s" -c ' % sys.executable
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    @unittest.skipIf(ThreadPoolExecutor is None, "requires concurrent.futures")
+    def test_runmany_1(test):
+        """Results are yielded in completion order by default."""
+        cmds = [PY + '"import time; time.sleep(0.5); print(1)"', PY + '"print(2)"']
+        results = list(runmany(cmds, workers=2))
+        test.assertEqual(["2", "1"], [r.stdout.strip() for r in results])
+        test.assertEqual([0, 0], [r.exitcode for r in results])
+        test.assertTrue(results[1].duration >= 0.5)
+
+    def test_runmany_2(test):
+        """Results can be yielded in input order."""
+        cmds = [PY + '"import time; time.sleep(0.3 - 0.1 * %d); print(%d)"' % (i, i) for i in range(3)]
+        results = list(runmany(iter(cmds), workers=3, ordered=True))
+        test.assertEqual(cmds, [r.cmd for r in results])
+        test.assertEqual(["0", "1", "2"], [r.stdout.strip() for r in results])
+
+    def test_runmany_3(test):
+        """Stops on the first failure."""
+        cmds = [PY + '"import sys; sys.stderr.write(\'err\'); sys.exit(3)"'] + [PY + '"print(0)"'] * 10
+        for workers in (1, 2):
+            results = list(runmany(cmds, workers=workers, ordered=True, stoponfail=True))
+            test.assertEqual(1, len(results))
+            test.assertEqual(3, results[0].exitcode)
+            test.assertEqual("err", results[0].stderr)
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import sys
+
+from testlib import *
+
+if sys.version_info >= (3, 7):
+    import asynclib
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+PY = '"%s" -c ' % sys.executable
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+@unittest.skipIf(sys.version_info < (3, 7), "requires asyncio.run()")
+class TestCase(BaseTest):
+    def test_acall_1(test):
+        """Exit codes are returned."""
+        result = asynclib.run(asynclib.silents(PY + '"import sys; sys.exit(2)"', PY + '"print(1)"'))
+        test.assertEqual([2, 0], result)
+
+    def test_aiterout_1(test):
+        """Lines of stdout and stderr."""
+        cmd = PY + '"import sys; print(1); print(2); sys.stderr.write(\'err\')"'
+        test.assertEqual((["1", "2"], "1\n2", "err"), asynclib.run(asynclib.outputs(cmd)))
+
+    def test_aiterout_2(test):
+        """Lines longer than the stream reader limit."""
+        result = asynclib.run(asynclib.listout(PY + '"print(\'x\' * 200000); print(1)"'))
+        test.assertEqual(["x" * 200000, "1"], result)
+
+    def test_astart_1(test):
+        """Started processes can be awaited."""
+        result = asynclib.run(asynclib.startwait(PY + '"import sys; sys.exit(3)"'))
+        test.assertEqual((3, False, 3), result)
+
+    def test_astart_2(test):
+        """Started processes can be stopped."""
+        result = asynclib.run(asynclib.startstop(PY + '"import time; time.sleep(10)"'))
+        test.assertEqual((True, False), result)
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
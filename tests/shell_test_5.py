@@ -0,0 +1,60 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import sys
+
+from testlib import *
+
+from auxly.shell import iterboth, itererr, listout
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+PY = '"%s" -c ' % sys.executable
+
+#: Writes a large amount of output to both streams.
+NOISY = PY + '"import sys; [sys.stderr.write(\'e\' * 99 + chr(10)) for _ in range(5000)]; print(\'done\')"'
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_iterboth_1(test):
+        """Both streams are yielded."""
+        cmd = PY + '"import sys; print(1); sys.stdout.flush(); sys.stderr.write(\'2\\r\\n3\')"'
+        result = list(iterboth(cmd))
+        test.assertEqual([("out", "1")], [r for r in result if "out" == r[0]])
+        test.assertEqual([("err", "2"), ("err", "3")], [r for r in result if "err" == r[0]])
+
+    def test_iterboth_2(test):
+        """Heavy output on one stream does not stall the other."""
+        result = list(iterboth(NOISY))
+        test.assertEqual(5001, len(result))
+        test.assertEqual(("out", "done"), [r for r in result if "out" == r[0]][0])
+
+    def test_iterboth_3(test):
+        """Streams can be merged."""
+        result = list(iterboth(NOISY, merge=True))
+        test.assertEqual(5001, len(result))
+        test.assertEqual(set(["out"]), set(r[0] for r in result))
+
+    def test_iterstd_1(test):
+        """Reading a single stream does not stall on the other."""
+        test.assertEqual(["done"], listout(NOISY))
+        test.assertEqual(5000, len(list(itererr(NOISY))))
+
+    def test_iterstd_2(test):
+        """Iteration can stop early."""
+        for line in itererr(NOISY):
+            break
+        test.assertEqual("e" * 99, line)
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()
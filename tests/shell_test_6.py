@@ -0,0 +1,58 @@
+##==============================================================#
+## SECTION: Imports                                             #
+##==============================================================#
+
+import os
+import sys
+
+from testlib import *
+
+from auxly.shell import has, run
+
+##==============================================================#
+## SECTION: Global Definitions                                  #
+##==============================================================#
+
+PY = '"%s" -c ' % sys.executable
+
+##==============================================================#
+## SECTION: Class Definitions                                   #
+##==============================================================#
+
+class TestCase(BaseTest):
+    def test_run_1(test):
+        """Output and exit code come from a single run."""
+        result = run(PY + '"import sys; print(1); sys.stderr.write(\'2\'); sys.exit(3)"')
+        test.assertEqual(3, result.exitcode)
+        test.assertEqual("1", result.stdout.strip())
+        test.assertEqual("2", result.stderr)
+        test.assertTrue(result.duration > 0)
+
+    def test_run_2(test):
+        """Resource usage is reported where available."""
+        result = run(PY + '"x = bytearray(50 * 1024 * 1024); sum(range(1000000))"')
+        test.assertEqual(0, result.exitcode)
+        if not hasattr(os, "wait4"):
+            test.assertEqual(None, result.maxrss)
+            return
+        test.assertTrue(result.maxrss >= 50 * 1024 * 1024)
+        test.assertTrue(result.utime + result.stime > 0)
+
+    def test_run_3(test):
+        """Large outputs on both streams."""
+        result = run(PY + '"import sys; sys.stdout.write(\'o\' * 500000); sys.stderr.write(\'e\' * 500000)"')
+        test.assertEqual(500000, len(result.stdout))
+        test.assertEqual(500000, len(result.stderr))
+
+    def test_has_1(test):
+        """Probing still finds shell builtins."""
+        if not os.name == "nt":
+            test.assertTrue(has("cd"))
+            test.assertFalse(has("fakecmd_xyz"))
+
+##==============================================================#
+## SECTION: Main Body                                           #
+##==============================================================#
+
+if __name__ == '__main__':
+    unittest.main()